@@ -7,11 +7,15 @@ Uso:
 
 import io
 from datetime import date, timedelta
+from functools import partial
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
-from plotly.subplots import make_subplots
+import xlsxwriter
 
 from bacendata import sgs
 from bacendata.wrapper.catalogo import CATALOGO, listar
@@ -40,6 +44,13 @@ CORES = [
     "#8c564b",  # marrom
 ]
 
+# Reducao de pontos para exibicao (LTTB)
+LIMIAR_REDUCAO = 3000  # series maiores que isso sao reduzidas no grafico
+PONTOS_REDUCAO = 2000  # pontos exibidos apos a reducao
+
+# Troca separadores de milhar/decimal (1,234.56 -> 1.234,56) em uma unica passada
+_PTBR_TRANS = str.maketrans({",": ".", ".": ","})
+
 CATEGORIAS = {
     "Taxas de Juros": [11, 12, 4390, 4189, 25434],
     "Inflação": [433],
@@ -115,16 +126,59 @@ DESCRICOES_DETALHADAS = {
 # =============================================================================
 
 
+@st.cache_resource
+def ativar_cache_local() -> None:
+    """Ativa o cache SQLite do wrapper uma vez por processo.
+
+    Fica abaixo do st.cache_data: sobrevive a reinicios do servidor, entao
+    visitas "frias" ao dashboard nao pagam a latencia do SGS de novo.
+    """
+    sgs.cache.ativar()
+
+
+ativar_cache_local()
+
+
 @st.cache_data(ttl=3600, show_spinner=False)
+def _buscar_serie_api(codigo: int, inicio: str, fim: str) -> pd.DataFrame:
+    """Busca serie no SGS com cache do Streamlit (1 hora).
+
+    Excecoes nao sao cacheadas: uma falha transitoria da API nao fica presa no cache.
+    """
+    return sgs.get(codigo, start=inicio, end=fim)
+
+
 def buscar_serie(codigo: int, inicio: str, fim: str) -> pd.DataFrame:
-    """Busca serie com cache do Streamlit (1 hora)."""
+    """Busca serie; se a API falhar, usa o ultimo resultado obtido na sessao."""
+    chave = f"ultimo_{codigo}"
     try:
-        df = sgs.get(codigo, start=inicio, end=fim)
-        return df
+        df = _buscar_serie_api(codigo, inicio, fim)
     except Exception as e:
+        anterior = st.session_state.get(chave)
+        if anterior is not None and anterior[:2] == (inicio, fim):
+            st.warning(f"Falha ao atualizar série {codigo}; exibindo os últimos dados obtidos.")
+            return anterior[2]
         st.error(f"Erro ao buscar série {codigo}: {e}")
         return pd.DataFrame(columns=["valor"])
 
+    st.session_state[chave] = (inicio, fim, df)
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def buscar_series_multi(codigos: tuple, inicio: str, fim: str) -> dict:
+    """Busca varias series em uma unica chamada ao wrapper (com cache).
+
+    O wrapper busca as series em paralelo, compartilhando conexoes.
+    Retorna dict codigo -> DataFrame com coluna 'valor'.
+    """
+    df = sgs.get({str(c): c for c in codigos}, start=inicio, end=fim)
+    return {
+        c: df[[str(c)]].dropna().rename(columns={str(c): "valor"})
+        for c in codigos
+        if str(c) in df.columns
+    }
+
 
 @st.cache_data(ttl=3600, show_spinner=False)
 def buscar_serie_last(codigo: int, n: int) -> pd.DataFrame:
@@ -137,6 +191,39 @@ def buscar_serie_last(codigo: int, n: int) -> pd.DataFrame:
         return pd.DataFrame(columns=["valor"])
 
 
+@st.cache_data(ttl=86400, show_spinner=False)
+def opcoes_categoria(categoria: str) -> dict:
+    """Opcoes do seletor de serie de uma categoria (rotulo -> codigo)."""
+    return {f"{CATALOGO[c].nome} ({c})": c for c in CATEGORIAS[categoria]}
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def opcoes_catalogo() -> dict:
+    """Opcoes de todas as series do catalogo (rotulo -> codigo)."""
+    return {f"{s.nome} ({s.codigo})": s.codigo for s in listar()}
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def catalogo_df() -> pd.DataFrame:
+    """Tabela do catalogo exibida na pagina Sobre (estatica por release)."""
+    df_cat = pd.DataFrame(
+        [
+            {
+                "Código": serie.codigo,
+                "Nome": serie.nome,
+                "Periodicidade": serie.periodicidade,
+                "Unidade": serie.unidade,
+                "Aliases": ", ".join(serie.aliases),
+            }
+            for serie in listar()
+        ]
+    )
+    # Colunas de baixa cardinalidade: dictionary encoding no Arrow enviado ao navegador
+    df_cat["Periodicidade"] = df_cat["Periodicidade"].astype("category")
+    df_cat["Unidade"] = df_cat["Unidade"].astype("category")
+    return df_cat
+
+
 def calcular_datas(periodo_dias, data_inicio=None, data_fim=None):
     """Retorna inicio e fim baseado no periodo selecionado."""
     if periodo_dias == "custom":
@@ -152,9 +239,9 @@ def calcular_datas(periodo_dias, data_inicio=None, data_fim=None):
 def formatar_valor(valor: float, unidade: str) -> str:
     """Formata valor com unidade."""
     if "R$" in unidade:
-        return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return f"R$ {valor:,.2f}".translate(_PTBR_TRANS)
     if "US$" in unidade:
-        return f"US$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        return f"US$ {valor:,.2f}".translate(_PTBR_TRANS)
     if "%" in unidade:
         return f"{valor:.4f}%"
     return f"{valor:.4f}"
@@ -165,19 +252,100 @@ def calcular_variacao(df: pd.DataFrame) -> dict:
     if df.empty or len(df) < 2:
         return {"ultimo": None, "var_abs": None, "var_pct": None}
 
-    ultimo = df["valor"].iloc[-1]
-    penultimo = df["valor"].iloc[-2]
+    vals = df["valor"].to_numpy()
+    ultimo, penultimo = vals[-1], vals[-2]
+    if not (np.isfinite(ultimo) and np.isfinite(penultimo)):
+        return {"ultimo": ultimo, "var_abs": None, "var_pct": None}
+
     var_abs = ultimo - penultimo
     var_pct = (var_abs / penultimo * 100) if penultimo != 0 else 0
 
     return {"ultimo": ultimo, "var_abs": var_abs, "var_pct": var_pct}
 
 
-def criar_grafico_serie(df: pd.DataFrame, nome: str, unidade: str, cor: str = CORES[0]):
+def calcular_media_movel(valores: np.ndarray, janela: int) -> np.ndarray:
+    """Media movel simples em O(n) via soma acumulada.
+
+    Equivale a `pd.Series.rolling(janela).mean()`: as primeiras `janela - 1`
+    posicoes, e janelas com valores ausentes, ficam NaN.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    saida = np.full(valores.shape, np.nan)
+    if len(valores) < janela:
+        return saida
+
+    validos = ~np.isnan(valores)
+    soma = np.concatenate(([0.0], np.cumsum(np.where(validos, valores, 0.0))))
+    contagem = np.concatenate(([0], np.cumsum(validos)))
+
+    soma_janela = soma[janela:] - soma[:-janela]
+    completas = (contagem[janela:] - contagem[:-janela]) == janela
+    saida[janela - 1 :] = np.where(completas, soma_janela / janela, np.nan)
+    return saida
+
+
+def reduzir_lttb(df: pd.DataFrame, n_alvo: int = PONTOS_REDUCAO) -> pd.DataFrame:
+    """Reduz a serie para `n_alvo` pontos com Largest-Triangle-Three-Buckets.
+
+    Mantem o formato visual da curva (picos e vales) enviando bem menos
+    pontos ao navegador. Usado apenas para exibicao; downloads usam o df completo.
+    """
+    n = len(df)
+    if n <= n_alvo or n_alvo < 3:
+        return df
+
+    x = df.index.asi8.astype(np.float64)
+    y = df["valor"].to_numpy(dtype=np.float64)
+
+    # Pontos internos divididos em n_alvo - 2 buckets; o ultimo "bucket" e o ponto final
+    bordas = np.append(np.linspace(1, n - 1, n_alvo - 1).astype(np.int64), n)
+    selecionados = np.empty(n_alvo, dtype=np.int64)
+    selecionados[0] = 0
+    selecionados[-1] = n - 1
+
+    anterior = 0
+    for i in range(n_alvo - 2):
+        ini, fim = bordas[i], bordas[i + 1]
+        prox_ini, prox_fim = bordas[i + 1], bordas[i + 2]
+        media_x = x[prox_ini:prox_fim].mean()
+        media_y = np.nanmean(y[prox_ini:prox_fim]) if prox_fim > prox_ini else y[-1]
+
+        # Area do triangulo (anterior, candidato, media do proximo bucket)
+        areas = np.abs(
+            (x[anterior] - media_x) * (y[ini:fim] - y[anterior])
+            - (x[anterior] - x[ini:fim]) * (media_y - y[anterior])
+        )
+        anterior = ini + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        selecionados[i + 1] = anterior
+
+    return df.iloc[selecionados]
+
+
+def media_movel_exibicao(df: pd.DataFrame, janela: int, alta_resolucao: bool) -> pd.DataFrame:
+    """Media movel pronta para o grafico, reduzida com LTTB como a serie base."""
+    df_mm = pd.DataFrame(
+        {"valor": calcular_media_movel(df["valor"].to_numpy(np.float64), janela)},
+        index=df.index,
+    ).iloc[janela - 1 :]
+    if not alta_resolucao and len(df_mm) > LIMIAR_REDUCAO:
+        df_mm = reduzir_lttb(df_mm)
+    return df_mm
+
+
+def criar_grafico_serie(
+    df: pd.DataFrame,
+    nome: str,
+    unidade: str,
+    cor: str = CORES[0],
+    alta_resolucao: bool = False,
+):
     """Cria grafico Plotly para uma serie."""
+    if not alta_resolucao and len(df) > LIMIAR_REDUCAO:
+        df = reduzir_lttb(df)
+
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df.index,
             y=df["valor"],
             mode="lines",
@@ -200,12 +368,58 @@ def criar_grafico_serie(df: pd.DataFrame, nome: str, unidade: str, cor: str = CO
     return fig
 
 
-def criar_grafico_comparacao(series_data: list):
+def assinatura_dados(df: pd.DataFrame) -> int:
+    """Hash vetorizado de datas e valores: muda se o BACEN revisar qualquer ponto."""
+    return int(pd.util.hash_pandas_object(df["valor"]).sum())
+
+
+def figura_serie(df: pd.DataFrame, info, alta_resolucao: bool = False):
+    """Retorna a figura da serie, reaproveitada entre reruns via session_state.
+
+    So reconstroi quando a serie, os dados ou a resolucao mudam; overlays como a
+    media movel sao trocados na mesma figura, e a chave inclui o conteudo dos dados
+    para uma revisao de valores nunca reaproveitar a figura antiga.
+    """
+    chave = (info.codigo, len(df), assinatura_dados(df), alta_resolucao)
+    guardada = st.session_state.get("fig_serie")
+    if guardada is not None and guardada[0] == chave:
+        return guardada[1]
+
+    fig = criar_grafico_serie(df, info.nome, info.unidade, alta_resolucao=alta_resolucao)
+    st.session_state["fig_serie"] = (chave, fig)
+    return fig
+
+
+def figura_comparacao(series_data: list, alta_resolucao: bool = False):
+    """Retorna a figura de comparacao, reaproveitada entre reruns via session_state.
+
+    Mesma ideia de figura_serie(): so reconstroi quando as series ou a resolucao mudam.
+    """
+    chave = (
+        tuple(
+            (item["codigo"], len(item["df"]), assinatura_dados(item["df"]))
+            for item in series_data
+        ),
+        alta_resolucao,
+    )
+    guardada = st.session_state.get("fig_comparacao")
+    if guardada is not None and guardada[0] == chave:
+        return guardada[1]
+
+    fig = criar_grafico_comparacao(series_data, alta_resolucao=alta_resolucao)
+    st.session_state["fig_comparacao"] = (chave, fig)
+    return fig
+
+
+def criar_grafico_comparacao(series_data: list, alta_resolucao: bool = False):
     """Cria grafico com multiplas series e eixo Y duplo se necessario."""
-    unidades = list(set(item["unidade"] for item in series_data))
+    # dict.fromkeys preserva a ordem: a primeira unidade fica sempre no eixo principal
+    unidades = list(dict.fromkeys(item["unidade"] for item in series_data))
     usar_eixo_duplo = len(unidades) > 1
 
     if usar_eixo_duplo:
+        from plotly.subplots import make_subplots
+
         fig = make_subplots(specs=[[{"secondary_y": True}]])
     else:
         fig = go.Figure()
@@ -214,9 +428,13 @@ def criar_grafico_comparacao(series_data: list):
         cor = CORES[i % len(CORES)]
         secondary = usar_eixo_duplo and item["unidade"] == unidades[1]
 
-        trace = go.Scatter(
-            x=item["df"].index,
-            y=item["df"]["valor"],
+        df_item = item["df"]
+        if not alta_resolucao and len(df_item) > LIMIAR_REDUCAO:
+            df_item = reduzir_lttb(df_item)
+
+        trace = go.Scattergl(
+            x=df_item.index,
+            y=df_item["valor"],
             mode="lines",
             name=f"{item['nome']} ({item['unidade']})",
             line=dict(color=cor, width=2),
@@ -249,13 +467,132 @@ def criar_grafico_comparacao(series_data: list):
     return fig
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def formatar_tabela(df: pd.DataFrame) -> pd.DataFrame:
+    """Copia do DataFrame com indice DD/MM/YYYY para exibicao (com cache)."""
+    df_display = df.copy()
+    df_display.index = df_display.index.strftime("%d/%m/%Y")
+    return df_display
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def df_para_csv(df: pd.DataFrame) -> bytes:
+    """Converte DataFrame para bytes CSV com o writer do PyArrow (com cache).
+
+    Passado ao download_button via partial(): so e gerado quando o usuario clica.
+    """
+    tabela = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+    # Datas sem horario, como no df.to_csv() do pandas
+    for i, campo in enumerate(tabela.schema):
+        if pa.types.is_timestamp(campo.type):
+            tabela = tabela.set_column(i, campo.name, tabela.column(i).cast(pa.date32()))
+    output = io.BytesIO()
+    pa_csv.write_csv(tabela, output)
+    return output.getvalue()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def df_para_excel(df: pd.DataFrame) -> bytes:
-    """Converte DataFrame para bytes Excel."""
+    """Converte DataFrame para bytes Excel (com cache, so regera se o df mudar).
+
+    Usa o xlsxwriter em modo constant_memory, que descarrega cada linha ao
+    avancar para a proxima; por isso a escrita e feita linha a linha.
+    """
     output = io.BytesIO()
-    df.to_excel(output, index=True, engine="openpyxl")
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+    worksheet = workbook.add_worksheet()
+    negrito = workbook.add_format({"bold": True})
+    formato_data = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    worksheet.set_column(0, 0, 12)
+
+    worksheet.write_row(0, 0, [df.index.name or "", *map(str, df.columns)], negrito)
+    valores = df.to_numpy(dtype=np.float64)
+    # Celulas vazias para NaN, como no df.to_excel()
+    linhas = np.where(np.isnan(valores), None, valores).tolist()
+    for i, (data, linha) in enumerate(zip(df.index.to_pydatetime(), linhas), start=1):
+        worksheet.write_datetime(i, 0, data, formato_data)
+        worksheet.write_row(i, 1, linha)
+
+    workbook.close()
     return output.getvalue()
 
 
+# =============================================================================
+# Fragmentos do grafico (media movel reroda so o grafico, nao a pagina)
+# =============================================================================
+
+
+def controles_media_movel(permite_dias: bool, key: str):
+    """Checkbox e slider da media movel. Retorna a janela, ou None se desligada."""
+    col_mm, col_janela = st.columns([1, 3])
+    with col_mm:
+        ativa = st.checkbox("Média móvel", value=False, key=f"mm_{key}")
+    if not ativa:
+        return None
+    with col_janela:
+        if permite_dias:
+            return st.slider(
+                "Janela (períodos/dias)", min_value=5, max_value=90, value=30, key=f"janela_{key}"
+            )
+        return st.slider("Janela (meses)", min_value=2, max_value=24, value=6, key=f"janela_{key}")
+
+
+@st.fragment
+def grafico_serie(df: pd.DataFrame, info, permite_dias: bool, alta_resolucao: bool) -> None:
+    """Grafico da serie unica com overlay de media movel."""
+    janela_mm = controles_media_movel(permite_dias, key="serie")
+
+    # Figura base reaproveitada; so o overlay de media movel e refeito
+    fig = figura_serie(df, info, alta_resolucao=alta_resolucao)
+
+    # Media movel: atualiza o trace existente em vez de recria-lo
+    if janela_mm and len(df) > janela_mm:
+        df_mm = media_movel_exibicao(df, janela_mm, alta_resolucao)
+        if len(fig.data) > 1:
+            fig.data[-1].update(x=df_mm.index, y=df_mm["valor"], name=f"MM{janela_mm}")
+        else:
+            fig.add_trace(
+                go.Scattergl(
+                    x=df_mm.index,
+                    y=df_mm["valor"],
+                    mode="lines",
+                    name=f"MM{janela_mm}",
+                    line=dict(color=CORES[1], width=1.5, dash="dash"),
+                )
+            )
+    else:
+        fig.data = fig.data[:1]
+
+    st.plotly_chart(fig, width="stretch", key=f"chart_{info.codigo}")
+
+
+@st.fragment
+def grafico_comparacao(series_data: list, permite_dias: bool, alta_resolucao: bool) -> None:
+    """Grafico de comparacao com overlays de media movel por serie."""
+    janela_mm = controles_media_movel(permite_dias, key="comparacao")
+
+    # Figura base reaproveitada; overlays de media movel refeitos
+    fig = figura_comparacao(series_data, alta_resolucao=alta_resolucao)
+    fig.data = fig.data[: len(series_data)]
+
+    if janela_mm:
+        for i, item in enumerate(series_data):
+            if len(item["df"]) > janela_mm:
+                df_mm = media_movel_exibicao(item["df"], janela_mm, alta_resolucao)
+                fig.add_trace(
+                    go.Scattergl(
+                        x=df_mm.index,
+                        y=df_mm["valor"],
+                        mode="lines",
+                        name=f"{item['nome']} MM{janela_mm}",
+                        line=dict(color=CORES[i % len(CORES)], width=1.5, dash="dash"),
+                        showlegend=True,
+                    )
+                )
+
+    st.plotly_chart(fig, width="stretch", key="chart_comparacao")
+
+
 # =============================================================================
 # Sidebar
 # =============================================================================
@@ -284,8 +621,7 @@ with st.sidebar:
         )
 
         # Series da categoria
-        codigos_cat = CATEGORIAS[categoria]
-        opcoes = {f"{CATALOGO[c].nome} ({c})": c for c in codigos_cat}
+        opcoes = opcoes_categoria(categoria)
         serie_selecionada = st.selectbox(
             "Série",
             list(opcoes.keys()),
@@ -301,7 +637,7 @@ with st.sidebar:
     elif pagina == "Comparar séries":
         # Comparacao: ate 3 series
         st.markdown("**Selecione até 3 séries:**")
-        todas_opcoes = {f"{s.nome} ({s.codigo})": s.codigo for s in listar()}
+        todas_opcoes = opcoes_catalogo()
         series_comparar = st.multiselect(
             "Séries para comparar",
             list(todas_opcoes.keys()),
@@ -364,13 +700,12 @@ with st.sidebar:
 
         st.divider()
 
-        # Media movel
-        media_movel = st.checkbox("Média móvel", value=False)
-        if media_movel:
-            if permite_dias:
-                janela_mm = st.slider("Janela (períodos/dias)", min_value=5, max_value=90, value=30)
-            else:
-                janela_mm = st.slider("Janela (meses)", min_value=2, max_value=24, value=6)
+        alta_resolucao = st.toggle(
+            "Alta resolução",
+            value=False,
+            help="Exibe todos os pontos no gráfico. Por padrão, séries longas são "
+            "reduzidas para facilitar a visualização.",
+        )
 
     st.divider()
     st.markdown(
@@ -438,23 +773,8 @@ if pagina == "Indicadores":
         )
         st.metric(label="Período", value=periodo_str)
 
-    # Grafico
-    fig = criar_grafico_serie(df, info.nome, info.unidade)
-
-    # Media movel
-    if media_movel and len(df) > janela_mm:
-        df_mm = df["valor"].rolling(window=janela_mm).mean()
-        fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df_mm,
-                mode="lines",
-                name=f"MM{janela_mm}",
-                line=dict(color=CORES[1], width=1.5, dash="dash"),
-            )
-        )
-
-    st.plotly_chart(fig, width="stretch")
+    # Grafico (em fragmento: mexer na media movel nao refaz busca nem tabela)
+    grafico_serie(df, info, permite_dias, alta_resolucao)
 
     # Tabela e download
     st.subheader("Dados")
@@ -462,32 +782,31 @@ if pagina == "Indicadores":
     col_tabela, col_download = st.columns([3, 1])
 
     with col_download:
-        csv = df.to_csv()
         st.download_button(
             label="📥 Baixar CSV",
-            data=csv,
+            data=partial(df_para_csv, df),
             file_name=f"bacendata_{info.codigo}_{periodo_label}.csv",
             mime="text/csv",
+            on_click="ignore",
         )
 
-        excel = df_para_excel(df)
         st.download_button(
             label="📥 Baixar Excel",
-            data=excel,
+            data=partial(df_para_excel, df),
             file_name=f"bacendata_{info.codigo}_{periodo_label}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            on_click="ignore",
         )
 
     with col_tabela:
-        df_display = df.copy()
-        df_display.index = df_display.index.strftime("%d/%m/%Y")
-        df_display = df_display.sort_index(ascending=False).head(50)
-        df_display.columns = [f"Valor ({info.unidade})"]
+        # df vem ordenado do wrapper: pega so as 50 datas mais recentes antes de copiar
+        df_display = formatar_tabela(df.tail(50).iloc[::-1])
+        df_display = df_display.set_axis([f"Valor ({info.unidade})"], axis=1)
         st.dataframe(df_display, width="stretch", height=400)
 
     # Info da serie
     with st.expander("Sobre esta série"):
-        desc = DESCRICOES_DETALHADAS.get(info.codigo, info.descricao)
+        desc = DESCRICOES_DETALHADAS.get(info.codigo) or info.descricao
         st.markdown(desc)
         st.markdown(f"""
 - **Código SGS:** {info.codigo}
@@ -515,13 +834,19 @@ elif pagina == "Comparar séries":
         st.info("Selecione pelo menos 2 séries na barra lateral para comparar.")
         st.stop()
 
-    # Buscar todas as series
+    # Buscar todas as series em uma unica chamada ao wrapper
     series_data = []
     with st.spinner("Buscando séries..."):
+        try:
+            dfs = buscar_series_multi(tuple(codigos_comparar), inicio, fim)
+        except Exception:
+            # Uma serie com erro derruba o lote: busca uma a uma (com fallback por serie)
+            dfs = {c: buscar_serie(c, inicio, fim) for c in codigos_comparar}
+
         for codigo in codigos_comparar:
             info = CATALOGO[codigo]
-            df = buscar_serie(codigo, inicio, fim)
-            if not df.empty:
+            df = dfs.get(codigo)
+            if df is not None and not df.empty:
                 series_data.append(
                     {"codigo": codigo, "nome": info.nome, "unidade": info.unidade, "df": df}
                 )
@@ -543,66 +868,52 @@ elif pagina == "Comparar séries":
                 delta=f"{stats['var_pct']:+.2f}%" if stats["var_pct"] is not None else None,
             )
 
-    # Grafico de comparacao
-    fig = criar_grafico_comparacao(series_data)
-
-    # Media movel na comparação
-    if media_movel:
-        for i, item in enumerate(series_data):
-            if len(item["df"]) > janela_mm:
-                df_mm = item["df"]["valor"].rolling(window=janela_mm).mean()
-                fig.add_trace(
-                    go.Scatter(
-                        x=item["df"].index,
-                        y=df_mm,
-                        mode="lines",
-                        name=f"{item['nome']} MM{janela_mm}",
-                        line=dict(color=CORES[i % len(CORES)], width=1.5, dash="dash"),
-                        showlegend=True,
-                    )
-                )
-
-    st.plotly_chart(fig, width="stretch")
+    # Grafico de comparacao (em fragmento, como na serie unica)
+    grafico_comparacao(series_data, permite_dias, alta_resolucao)
 
     # Tabela combinada
     st.subheader("Dados comparados")
 
-    df_combined = pd.DataFrame()
-    for item in series_data:
-        df_combined[f"{item['nome']} ({item['unidade']})"] = item["df"]["valor"]
-
+    df_combined = pd.concat(
+        {f"{item['nome']} ({item['unidade']})": item["df"]["valor"] for item in series_data},
+        axis=1,
+    )
     df_combined = df_combined.sort_index(ascending=False)
 
     col_tab, col_dl = st.columns([3, 1])
 
     with col_dl:
-        csv = df_combined.to_csv()
         st.download_button(
             label="📥 Baixar CSV",
-            data=csv,
+            data=partial(df_para_csv, df_combined),
             file_name=f"bacendata_comparacao_{periodo_label}.csv",
             mime="text/csv",
+            on_click="ignore",
         )
 
-        excel = df_para_excel(df_combined)
         st.download_button(
             label="📥 Baixar Excel",
-            data=excel,
+            data=partial(df_para_excel, df_combined),
             file_name=f"bacendata_comparacao_{periodo_label}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            on_click="ignore",
         )
 
     with col_tab:
-        df_display = df_combined.copy()
-        df_display.index = df_display.index.strftime("%d/%m/%Y")
-        st.dataframe(df_display.head(50), width="stretch", height=400)
+        df_display = formatar_tabela(df_combined.head(50))
+        st.dataframe(df_display, width="stretch", height=400)
 
     # Correlacao
     if len(series_data) >= 2:
         with st.expander("Correlação entre séries", expanded=True):
-            df_corr = df_combined.dropna()
-            if len(df_corr) > 10:
-                corr = df_corr.corr()
+            # float32 basta para correlacao e reduz pela metade os bytes processados;
+            # a mascara de NaN no NumPy substitui o dropna() do pandas
+            arr = df_combined.to_numpy(dtype=np.float32)
+            arr = arr[~np.isnan(arr).any(axis=1)]
+            if arr.shape[0] > 10:
+                matriz = np.corrcoef(arr, rowvar=False, dtype=np.float32)
+                colunas = df_combined.columns
+                corr = pd.DataFrame(matriz, index=colunas, columns=colunas)
 
                 fig_corr = go.Figure(
                     data=go.Heatmap(
@@ -712,18 +1023,7 @@ meta = sgs.metadata(11)
     )
 
     # Tabela de séries do catálogo
-    dados_catalogo = []
-    for serie in listar():
-        dados_catalogo.append(
-            {
-                "Código": serie.codigo,
-                "Nome": serie.nome,
-                "Periodicidade": serie.periodicidade,
-                "Unidade": serie.unidade,
-                "Aliases": ", ".join(serie.aliases),
-            }
-        )
-    df_cat = pd.DataFrame(dados_catalogo)
+    df_cat = catalogo_df()
     st.dataframe(df_cat, width="stretch", hide_index=True)
 
     st.divider()
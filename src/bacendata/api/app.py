@@ -13,10 +13,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from bacendata.api.middleware.rate_limit import RateLimitMiddleware
+from bacendata.api.middleware.rate_limit import REDIS_TIMEOUT, RateLimitMiddleware
 from bacendata.api.routes import dashboard, health, series, webhook
 from bacendata.core.config import settings
-from bacendata.wrapper import cache
+from bacendata.wrapper import bacen_sgs, cache
 
 logger = logging.getLogger("bacendata")
 
@@ -31,9 +31,31 @@ async def lifespan(app: FastAPI):
         await init_db(settings.database_url)
         logger.info("PostgreSQL conectado.")
 
+    # Startup: Redis para o rate limiting (opcional)
+    app.state.redis = None
+    if settings.redis_url:
+        import redis.asyncio as redis
+
+        app.state.redis = redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT,
+        )
+        try:
+            await app.state.redis.ping()
+            logger.info("Redis conectado para rate limiting.")
+        except Exception as e:
+            # Mantém o cliente: o middleware volta a tentar depois de REDIS_PAUSA
+            logger.warning("Redis indisponível no startup, usando contador em memória: %s", e)
+
     yield
 
-    # Shutdown: fechar conexão com banco
+    # Shutdown: fechar cliente HTTP do BACEN e conexões com Redis e banco
+    await bacen_sgs.fechar_cliente()
+
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+
     if settings.database_url:
         from bacendata.core.database import close_db
 
@@ -2,14 +2,17 @@
 bacendata.api.middleware.rate_limit
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-Middleware de rate limiting simples em memória.
+Middleware de rate limiting com janela diária.
 
-No MVP, usa um dicionário em memória. Em produção, usar Redis.
+Com BACENDATA_REDIS_URL configurado, o contador fica no Redis (INCR + EXPIRE atômicos
+via script Lua), compartilhado entre workers. Sem Redis, usa um dicionário em memória.
+Se o Redis cair, o middleware usa o dicionário por REDIS_PAUSA segundos antes de
+tentar de novo, em vez de esperar uma conexão a cada requisição.
 """
 
 import logging
 import time
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
@@ -19,6 +22,27 @@ from bacendata.core.config import settings
 
 logger = logging.getLogger("bacendata")
 
+# Rotas que não contam para o limite
+_SKIP_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
+
+# A cada N requisições, remove do dicionário os contadores com janela expirada
+_INTERVALO_LIMPEZA = 1000
+
+# Timeout (s) de conexão e de leitura do cliente Redis: com o Redis fora do ar, a
+# requisição espera no máximo isso antes de cair no contador em memória
+REDIS_TIMEOUT = 0.5
+
+# Depois de uma falha, segundos sem tentar o Redis (uma tentativa por pausa, e um
+# só aviso no log por indisponibilidade)
+REDIS_PAUSA = 30
+
+# INCR + EXPIRE numa única ida ao Redis: a chave expira junto com a janela
+_LUA_INCR = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return c
+"""
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Rate limiting por IP com janela diária.
@@ -30,9 +54,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app) -> None:  # type: ignore[no-untyped-def]
         super().__init__(app)
-        # {identificador: (contagem, timestamp_inicio_janela)}
-        self._contadores: Dict[str, Tuple[int, float]] = {}
+        # {identificador: [contagem, timestamp_inicio_janela]} — lista mutada no lugar
+        self._contadores: Dict[str, List[float]] = {}
         self._janela = 86400  # 24 horas em segundos
+        self._requisicoes = 0  # para disparar a limpeza periódica
+        # Instante até o qual o Redis não é tentado (0 = Redis disponível)
+        self._redis_pausado_ate = 0.0
 
     def _identificador(self, request: Request) -> str:
         """Retorna identificador único para rate limiting."""
@@ -51,23 +78,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return settings.rate_limit_free
 
     async def dispatch(self, request: Request, call_next):  # type: ignore[no-untyped-def]
-        # Não limitar health check e docs
-        if request.url.path in ("/health", "/docs", "/redoc", "/openapi.json"):
+        # Não limitar health check e docs (scope["path"] evita montar request.url)
+        path = request.scope["path"]
+        if path in _SKIP_PATHS:
             return await call_next(request)
 
         identificador = self._identificador(request)
         limite = self._limite_para_request(request)
         agora = time.time()
 
-        contagem, inicio = self._contadores.get(identificador, (0, agora))
-
-        # Resetar janela se expirou
-        if agora - inicio >= self._janela:
-            contagem = 0
-            inicio = agora
-
-        contagem += 1
-        self._contadores[identificador] = (contagem, inicio)
+        redis = getattr(request.app.state, "redis", None)
+        if redis is not None and agora >= self._redis_pausado_ate:
+            try:
+                contagem, inicio = await self._contar_redis(redis, identificador, agora)
+            except Exception as e:
+                if not self._redis_pausado_ate:
+                    logger.warning("Redis indisponível, usando contador em memória: %s", e)
+                self._redis_pausado_ate = agora + REDIS_PAUSA
+                contagem, inicio = self._contar_memoria(identificador, agora)
+            else:
+                if self._redis_pausado_ate:
+                    logger.info("Redis de volta para rate limiting.")
+                    self._redis_pausado_ate = 0.0
+        else:
+            contagem, inicio = self._contar_memoria(identificador, agora)
 
         if contagem > limite:
             tempo_restante = int(self._janela - (agora - inicio))
@@ -93,11 +127,47 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response.headers["X-RateLimit-Remaining"] = str(max(0, limite - contagem))
 
         # Registrar uso no banco (fire-and-forget)
-        await self._registrar_uso(request, response.status_code)
+        await self._registrar_uso(request, path, response.status_code)
 
         return response
 
-    async def _registrar_uso(self, request: Request, status_code: int) -> None:
+    def _contar_memoria(self, identificador: str, agora: float) -> Tuple[int, float]:
+        """Incrementa o contador local e retorna (contagem, inicio_janela)."""
+        self._requisicoes += 1
+        if self._requisicoes % _INTERVALO_LIMPEZA == 0:
+            self._limpar_expirados(agora)
+
+        estado = self._contadores.get(identificador)
+        if estado is None:
+            estado = [0, agora]
+            self._contadores[identificador] = estado
+
+        # Resetar janela se expirou
+        if agora - estado[1] >= self._janela:
+            estado[0] = 1
+            estado[1] = agora
+        else:
+            estado[0] += 1
+        return int(estado[0]), estado[1]
+
+    def _limpar_expirados(self, agora: float) -> None:
+        """Remove contadores cuja janela já expirou (mantém a memória limitada)."""
+        expirados = [k for k, v in self._contadores.items() if agora - v[1] >= self._janela]
+        for chave in expirados:
+            del self._contadores[chave]
+
+    async def _contar_redis(self, redis, identificador: str, agora: float) -> Tuple[int, float]:  # type: ignore[no-untyped-def]
+        """Incrementa o contador no Redis e retorna (contagem, inicio_janela).
+
+        A janela é um bucket diário fixo: a chave inclui o número do bucket e expira
+        sozinha, então não há estado para limpar.
+        """
+        bucket = int(agora // self._janela)
+        chave = f"rl:{identificador}:{bucket}"
+        contagem = await redis.eval(_LUA_INCR, 1, chave, self._janela)
+        return int(contagem), float(bucket * self._janela)
+
+    async def _registrar_uso(self, request: Request, path: str, status_code: int) -> None:
         """Salva registro de uso no banco de dados (se disponível)."""
         try:
             from bacendata.core import database as db
@@ -115,7 +185,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 log = UsageLog(
                     api_key=api_key,
                     ip=client_ip,
-                    endpoint=request.url.path,
+                    endpoint=path,
                     status_code=status_code,
                 )
                 session.add(log)
@@ -4,11 +4,13 @@ bacendata.api.routes.auth
 
 Autenticação por API key.
 
-Busca chaves no PostgreSQL. Fallback para variável de ambiente BACENDATA_API_KEYS
-quando o banco de dados não está configurado.
+Busca chaves no PostgreSQL. Fallback para as keys geradas em memória pelo webhook
+e para a variável de ambiente BACENDATA_API_KEYS quando o banco de dados não está
+configurado.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 from fastapi import Header, HTTPException
@@ -24,6 +26,15 @@ PLANOS = {
 }
 
 
+# Keys geradas pelo webhook quando não há banco de dados: {chave: plano}
+_API_KEYS_MEMORIA: Dict[str, str] = {}
+
+
+def registrar_api_key_memoria(api_key: str, plano: str) -> None:
+    """Registra uma API key em memória (fallback do webhook sem banco de dados)."""
+    _API_KEYS_MEMORIA[api_key] = plano
+
+
 def _carregar_api_keys_env() -> Dict[str, str]:
     """Carrega API keys da variável de ambiente (fallback).
 
@@ -31,9 +42,18 @@ def _carregar_api_keys_env() -> Dict[str, str]:
     """
     if not settings.api_keys:
         return {}
+    return _parse_api_keys(settings.api_keys)
 
+
+@lru_cache(maxsize=1)
+def _parse_api_keys(api_keys: str) -> Dict[str, str]:
+    """Faz o parse da string de API keys (com cache).
+
+    A chave do cache é a própria string: se settings.api_keys mudar em runtime
+    (ex: fallback do webhook), o parse é refeito automaticamente.
+    """
     keys = {}
-    for item in settings.api_keys.split(","):
+    for item in api_keys.split(","):
         item = item.strip()
         if ":" in item:
             chave, plano = item.split(":", 1)
@@ -80,7 +100,11 @@ async def autenticar_api_key(
         if plano:
             return (x_api_key, plano)
 
-    # Fallback: variável de ambiente
+    # Fallback: keys geradas em memória e variável de ambiente
+    plano = _API_KEYS_MEMORIA.get(x_api_key)
+    if plano:
+        return (x_api_key, plano)
+
     api_keys_env = _carregar_api_keys_env()
     if api_keys_env:
         plano = api_keys_env.get(x_api_key)
@@ -88,7 +112,7 @@ async def autenticar_api_key(
             return (x_api_key, plano)
 
     # Se não há nenhuma fonte de keys configurada, acesso livre
-    if not db_ativo and not api_keys_env:
+    if not db_ativo and not api_keys_env and not _API_KEYS_MEMORIA:
         return (None, "free")
 
     # Key inválida
@@ -5,24 +5,30 @@ bacendata.api.routes.series
 Endpoints da API para consulta de séries temporais do BACEN SGS.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from bacendata.api.routes.auth import autenticar_api_key
 from bacendata.schemas.series import (
     BulkRequest,
     BulkResponse,
+    BulkSerieItem,
     BulkSerieResponse,
     CatalogoResponse,
     ErrorResponse,
     SerieCatalogo,
+    SerieColunas,
     SerieMetadata,
     SerieResponse,
+    SerieResponseColunar,
     SerieValor,
 )
 from bacendata.wrapper import bacen_sgs as sgs
+from bacendata.wrapper import cache
 from bacendata.wrapper.catalogo import CATALOGO, buscar_por_nome, listar
 from bacendata.wrapper.exceptions import (
     BacenAPIError,
@@ -36,14 +42,48 @@ logger = logging.getLogger("bacendata")
 
 router = APIRouter(prefix="/api/v1", tags=["Séries Temporais"])
 
+# O catálogo é estático: os itens de resposta são montados uma vez no import
+_CATALOGO_ITEMS: Dict[int, SerieCatalogo] = {
+    s.codigo: SerieCatalogo(
+        codigo=s.codigo,
+        nome=s.nome,
+        descricao=s.descricao,
+        periodicidade=s.periodicidade,
+        unidade=s.unidade,
+        aliases=s.aliases,
+    )
+    for s in listar()
+}
+_CATALOGO_RESPONSE = CatalogoResponse(
+    series=list(_CATALOGO_ITEMS.values()), total=len(_CATALOGO_ITEMS)
+)
+# Corpo JSON do catálogo já serializado: a rota devolve os bytes sem revalidar
+_CATALOGO_JSON = _CATALOGO_RESPONSE.model_dump_json().encode()
+
+# Termos distintos de busca no catálogo com resposta memoizada
+MAX_BUSCAS_MEMORIA = 256
+
+# Máximo de séries do bulk buscadas em paralelo (respeita o rate limit do BACEN)
+BULK_MAX_CONCURRENT = 8
+
+
+def _df_para_colunas(df) -> Tuple[List[str], List[float]]:  # type: ignore[type-arg]
+    """Extrai (datas DD/MM/YYYY, valores) do DataFrame de forma vetorizada."""
+    if hasattr(df.index, "strftime"):
+        datas = df.index.strftime("%d/%m/%Y").tolist()
+    else:
+        datas = [str(idx) for idx in df.index]
+    valores = df["valor"].astype(float).tolist()
+    return datas, valores
+
 
 def _df_para_valores(df) -> List[SerieValor]:  # type: ignore[type-arg]
-    """Converte DataFrame para lista de SerieValor."""
-    valores = []
-    for idx, row in df.iterrows():
-        data_str = idx.strftime("%d/%m/%Y") if hasattr(idx, "strftime") else str(idx)
-        valores.append(SerieValor(data=data_str, valor=float(row["valor"])))
-    return valores
+    """Converte DataFrame para lista de SerieValor.
+
+    Como os floats vêm do próprio wrapper, os modelos são construídos sem revalidação.
+    """
+    datas, valores = _df_para_colunas(df)
+    return [SerieValor.model_construct(data=d, valor=v) for d, v in zip(datas, valores)]
 
 
 def _info_catalogo(codigo: int) -> dict:
@@ -60,7 +100,7 @@ def _info_catalogo(codigo: int) -> dict:
 
 @router.get(
     "/series/{codigo}",
-    response_model=SerieResponse,
+    response_model=Union[SerieResponse, SerieResponseColunar],
     responses={404: {"model": ErrorResponse}, 502: {"model": ErrorResponse}},
     summary="Consultar série temporal",
     description="Busca dados de uma série SGS do BACEN por código numérico ou nome do catálogo.",
@@ -74,17 +114,39 @@ async def get_serie(
         None, description="Data final (YYYY-MM-DD ou DD/MM/YYYY)", alias="end"
     ),
     last: Optional[int] = Query(None, gt=0, description="Últimos N valores"),
+    formato: str = Query(
+        "rows",
+        alias="format",
+        pattern="^(rows|columnar)$",
+        description=(
+            "Formato de 'dados': 'rows' (lista de {data, valor}) ou 'columnar' "
+            "({datas: [...], valores: [...]}, mais leve para séries longas)"
+        ),
+    ),
     auth: tuple = Depends(autenticar_api_key),
-) -> SerieResponse:
+) -> Union[SerieResponse, SerieResponseColunar]:
     """Consulta uma série temporal do BACEN."""
     try:
         # Resolver nome para código se necessário
         codigo_int = _resolver_codigo(codigo)
 
         df = await sgs.aget(codigo_int, start=start, end=end, last=last)
-        valores = _df_para_valores(df)
         info = _info_catalogo(codigo_int)
 
+        if formato == "columnar":
+            # Sem um modelo Pydantic por ponto: duas listas validadas/serializadas em bloco
+            datas, valores_col = _df_para_colunas(df)
+            return SerieResponseColunar(
+                codigo=codigo_int,
+                nome=info["nome"],
+                periodicidade=info["periodicidade"],
+                unidade=info["unidade"],
+                dados=SerieColunas(datas=datas, valores=valores_col),
+                total=len(datas),
+            )
+
+        valores = _df_para_valores(df)
+
         return SerieResponse(
             codigo=codigo_int,
             nome=info["nome"],
@@ -143,36 +205,40 @@ async def get_series_bulk(
     body: BulkRequest,
     auth: tuple = Depends(autenticar_api_key),
 ) -> BulkResponse:
-    """Consulta múltiplas séries em uma requisição."""
-    resultados = []
+    """Consulta múltiplas séries em uma requisição.
+
+    As séries são buscadas em paralelo, limitadas por BULK_MAX_CONCURRENT.
+    """
+    semaforo = asyncio.Semaphore(BULK_MAX_CONCURRENT)
 
-    for item in body.series:
+    async def _buscar_item(item: BulkSerieItem) -> BulkSerieResponse:
         try:
             codigo_int = _resolver_codigo(item.codigo)
-            df = await sgs.aget(codigo_int, start=body.start, end=body.end, last=body.last)
+            async with semaforo:
+                df = await sgs.aget(codigo_int, start=body.start, end=body.end, last=body.last)
             valores = _df_para_valores(df)
             info = _info_catalogo(codigo_int)
 
-            resultados.append(
-                BulkSerieResponse(
-                    codigo=codigo_int,
-                    nome=item.nome or info["nome"],
-                    dados=valores,
-                    total=len(valores),
-                )
+            return BulkSerieResponse(
+                codigo=codigo_int,
+                nome=item.nome or info["nome"],
+                dados=valores,
+                total=len(valores),
             )
         except BacenDataError as e:
             logger.warning("Erro ao buscar série %s no bulk: %s", item.codigo, e)
-            resultados.append(
-                BulkSerieResponse(
-                    codigo=codigo_int if isinstance(item.codigo, int) else 0,
-                    nome=item.nome or str(item.codigo),
-                    dados=[],
-                    total=0,
-                )
+            return BulkSerieResponse(
+                codigo=codigo_int if isinstance(item.codigo, int) else 0,
+                nome=item.nome or str(item.codigo),
+                dados=[],
+                total=0,
             )
 
-    return BulkResponse(series=resultados, total_series=len(resultados))
+    # Escritas no cache de todas as séries num único commit
+    with cache.lote():
+        resultados = await asyncio.gather(*(_buscar_item(item) for item in body.series))
+
+    return BulkResponse(series=list(resultados), total_series=len(resultados))
 
 
 @router.get(
@@ -183,21 +249,9 @@ async def get_series_bulk(
 )
 async def get_catalogo(
     auth: tuple = Depends(autenticar_api_key),
-) -> CatalogoResponse:
+) -> Response:
     """Lista todas as séries do catálogo."""
-    series = listar()
-    items = [
-        SerieCatalogo(
-            codigo=s.codigo,
-            nome=s.nome,
-            descricao=s.descricao,
-            periodicidade=s.periodicidade,
-            unidade=s.unidade,
-            aliases=s.aliases,
-        )
-        for s in series
-    ]
-    return CatalogoResponse(series=items, total=len(items))
+    return Response(content=_CATALOGO_JSON, media_type="application/json")
 
 
 @router.get(
@@ -209,30 +263,17 @@ async def get_catalogo(
 async def search_catalogo(
     q: str = Query(..., min_length=1, description="Termo de busca"),
     auth: tuple = Depends(autenticar_api_key),
-) -> CatalogoResponse:
+) -> Response:
     """Busca séries no catálogo por nome ou alias."""
-    q_lower = q.lower()
-    resultados = []
-
-    for serie in listar():
-        # Buscar no nome, descrição e aliases
-        if (
-            q_lower in serie.nome.lower()
-            or q_lower in serie.descricao.lower()
-            or any(q_lower in alias.lower() for alias in serie.aliases)
-        ):
-            resultados.append(
-                SerieCatalogo(
-                    codigo=serie.codigo,
-                    nome=serie.nome,
-                    descricao=serie.descricao,
-                    periodicidade=serie.periodicidade,
-                    unidade=serie.unidade,
-                    aliases=serie.aliases,
-                )
-            )
+    return Response(content=_buscar_catalogo_json(q.lower()), media_type="application/json")
+
 
-    return CatalogoResponse(series=resultados, total=len(resultados))
+@lru_cache(maxsize=MAX_BUSCAS_MEMORIA)
+def _buscar_catalogo_json(termo: str) -> bytes:
+    """Corpo JSON da busca por um termo (em minúsculas); o catálogo é estático."""
+    # Buscar no nome, descrição e aliases
+    resultados = [_CATALOGO_ITEMS[serie.codigo] for serie in listar() if serie.contem(termo)]
+    return CatalogoResponse(series=resultados, total=len(resultados)).model_dump_json().encode()
 
 
 def _resolver_codigo(codigo: Union[int, str]) -> int:
@@ -11,56 +11,151 @@ Fluxo:
 4. Key é retornada na resposta
 """
 
-import hashlib
 import hmac
 import json
 import logging
-import secrets
+import os
 import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Request
 
+try:  # msgspec é opcional: sem ele o evento é lido com json.loads
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+from bacendata.api.routes.auth import registrar_api_key_memoria
 from bacendata.core.config import settings
 
 logger = logging.getLogger("bacendata")
 
 router = APIRouter(tags=["Webhook"])
 
+# Tolerância entre o timestamp assinado pelo Stripe e o relógio local
+WEBHOOK_TOLERANCE_SEC = 300
+_TOLERANCE_NS = WEBHOOK_TOLERANCE_SEC * 1_000_000_000
+
+# Prefixo que identifica API keys do BacenData
+_PREFIXO_API_KEY = "bcd_"
+
 
 def _price_to_plan() -> dict[str, str]:
     """Mapeamento de Price ID → plano, configurável via env vars."""
+    return _montar_price_to_plan(settings.stripe_price_pro, settings.stripe_price_enterprise)
+
+
+@lru_cache(maxsize=1)
+def _montar_price_to_plan(
+    price_pro: Optional[str], price_enterprise: Optional[str]
+) -> dict[str, str]:
+    """Monta o mapeamento uma vez por combinação de Price IDs (não a cada evento)."""
     mapping = {}
-    if settings.stripe_price_pro:
-        mapping[settings.stripe_price_pro] = "pro"
-    if settings.stripe_price_enterprise:
-        mapping[settings.stripe_price_enterprise] = "enterprise"
+    if price_pro:
+        mapping[price_pro] = "pro"
+    if price_enterprise:
+        mapping[price_enterprise] = "enterprise"
     return mapping
 
 
+if msgspec is not None:
+    # Só os campos do evento que o webhook usa; o resto (line_items expandidos,
+    # customer_details completos etc.) é descartado no parse, sem virar dict.
+
+    class _Preco(msgspec.Struct, omit_defaults=True):
+        id: Optional[str] = None
+
+    class _LineItem(msgspec.Struct, omit_defaults=True):
+        price: Optional[_Preco] = None
+
+    class _LineItems(msgspec.Struct, omit_defaults=True):
+        data: Optional[List[_LineItem]] = None
+
+    class _CustomerDetails(msgspec.Struct, omit_defaults=True):
+        email: Optional[str] = None
+
+    class _Sessao(msgspec.Struct, omit_defaults=True):
+        id: Optional[str] = None
+        customer_email: Optional[str] = None
+        customer_details: Optional[_CustomerDetails] = None
+        line_items: Optional[_LineItems] = None
+        metadata: Optional[Dict[str, Any]] = None
+
+    class _DadosEvento(msgspec.Struct, omit_defaults=True):
+        object: Optional[_Sessao] = None
+
+    class _EventoStripe(msgspec.Struct, omit_defaults=True):
+        type: Optional[str] = None
+        data: Optional[_DadosEvento] = None
+
+    _decoder_evento = msgspec.json.Decoder(_EventoStripe)
+
+
+def _decodificar_evento(payload: bytes) -> Dict[str, Any]:
+    """Decodifica o evento do Stripe. Levanta ValueError se o payload for inválido.
+
+    Com msgspec, só os campos usados são materializados (como dict, para o
+    restante do handler não depender do parser).
+    """
+    if msgspec is None:
+        return json.loads(payload)
+    try:
+        return msgspec.to_builtins(_decoder_evento.decode(payload))
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
 def _gerar_api_key() -> str:
     """Gera uma API key segura com prefixo identificador."""
-    token = secrets.token_hex(24)
-    return f"bcd_{token}"
+    # os.urandom é a mesma fonte do secrets.token_hex, sem a camada extra
+    return _PREFIXO_API_KEY + os.urandom(24).hex()
+
+
+@lru_cache(maxsize=1)
+def _secret_bytes(secret: str) -> bytes:
+    """Secret do webhook em bytes (codificado uma vez por valor de secret)."""
+    return secret.encode()
 
 
 def _verificar_assinatura(payload: bytes, sig_header: str, secret: str) -> bool:
     """Verifica assinatura do webhook Stripe (v1)."""
-    try:
-        elements = dict(item.split("=", 1) for item in sig_header.split(","))
-        timestamp = elements.get("t", "")
-        signature = elements.get("v1", "")
-
-        signed_payload = f"{timestamp}.{payload.decode()}"
-        expected = hmac.new(secret.encode(), signed_payload.encode(), hashlib.sha256).hexdigest()
+    # Extrai só t e v1 do header (ex: "t=123,v1=abc,v0=def")
+    timestamp = ""
+    assinaturas = []
+    for item in sig_header.split(","):
+        chave, _, valor = item.partition("=")
+        if chave == "t":
+            timestamp = valor
+        elif chave == "v1":
+            assinaturas.append(valor)
 
-        # Verificar tolerância de tempo (5 minutos)
-        if abs(time.time() - int(timestamp)) > 300:
+    try:
+        # Verificar tolerância de tempo antes do HMAC: rejeita replays sem hash.
+        # Comparação só com inteiros (ns), sem aritmética de float.
+        if abs(time.time_ns() - int(timestamp) * 1_000_000_000) > _TOLERANCE_NS:
             return False
+    except ValueError:
+        return False  # timestamp ausente ou malformado
 
-        return hmac.compare_digest(expected, signature)
+    try:
+        # Payload assinado montado direto em bytes (sem decode/encode do corpo)
+        signed_payload = timestamp.encode() + b"." + payload
+        # hmac.digest usa o caminho one-shot do OpenSSL; compara bytes, sem hexdigest
+        expected = hmac.digest(_secret_bytes(secret), signed_payload, "sha256")
     except Exception:
         return False
 
+    # Durante rotação de secret o Stripe envia mais de um v1: basta um conferir
+    for sig in assinaturas:
+        try:
+            recebida = bytes.fromhex(sig)
+        except ValueError:
+            continue  # Um v1 malformado não invalida os demais
+        if hmac.compare_digest(expected, recebida):
+            return True
+    return False
+
 
 async def _salvar_key_db(
     api_key: str, plano: str, email: str | None, session_id: str | None
@@ -91,8 +186,8 @@ async def stripe_webhook(request: Request):
             raise HTTPException(status_code=400, detail="Assinatura inválida")
 
     try:
-        event = json.loads(payload)
-    except json.JSONDecodeError:
+        event = _decodificar_evento(payload)
+    except ValueError:  # json.JSONDecodeError também é ValueError
         raise HTTPException(status_code=400, detail="Payload inválido")
 
     # Processar apenas checkout concluído
@@ -127,9 +222,7 @@ async def stripe_webhook(request: Request):
     if db.async_session is not None:
         await _salvar_key_db(api_key, plano, customer_email, session.get("id"))
     else:
-        existing = settings.api_keys or ""
-        new_entry = f"{api_key}:{plano}"
-        settings.api_keys = f"{existing},{new_entry}" if existing else new_entry
+        registrar_api_key_memoria(api_key, plano)
 
     logger.info(
         "Nova API key gerada: plano=%s email=%s key=%s...%s",
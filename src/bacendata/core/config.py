@@ -24,6 +24,10 @@ class Settings(BaseSettings):
     rate_limit_free: int = 100
     rate_limit_pro: int = 10_000
 
+    # Redis para rate limiting compartilhado entre workers (vazio = dicionário em memória)
+    # Formato: "redis://host:6379/0"
+    redis_url: Optional[str] = None
+
     # API Keys para demonstração (em produção, usar banco de dados)
     # Formato: "chave1:plano,chave2:plano" ex: "abc123:free,xyz789:pro"
     api_keys: Optional[str] = None
@@ -50,7 +54,14 @@ class Settings(BaseSettings):
     # Cache
     cache_ativo: bool = True
 
-    model_config = {"env_prefix": "BACENDATA_", "env_file": ".env", "extra": "ignore"}
+    # frozen: configuração é lida uma vez no startup e não muda em runtime, o que
+    # também mantém válidos os valores derivados memoizados (ex: índice de API keys)
+    model_config = {
+        "env_prefix": "BACENDATA_",
+        "env_file": ".env",
+        "extra": "ignore",
+        "frozen": True,
+    }
 
 
 settings = Settings()
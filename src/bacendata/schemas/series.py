@@ -32,6 +32,24 @@ class SerieResponse(BaseModel):
     total: int = Field(..., description="Total de registros retornados")
 
 
+class SerieColunas(BaseModel):
+    """Dados de uma série em formato colunar (listas paralelas)."""
+
+    datas: List[str] = Field(..., description="Datas no formato DD/MM/YYYY")
+    valores: List[float] = Field(..., description="Valores numéricos, na ordem das datas")
+
+
+class SerieResponseColunar(BaseModel):
+    """Resposta para consulta de série única com ?format=columnar."""
+
+    codigo: int = Field(..., description="Código SGS da série")
+    nome: Optional[str] = Field(None, description="Nome da série (se disponível no catálogo)")
+    periodicidade: Optional[str] = Field(None, description="Periodicidade da série")
+    unidade: Optional[str] = Field(None, description="Unidade de medida")
+    dados: SerieColunas = Field(..., description="Datas e valores da série")
+    total: int = Field(..., description="Total de registros retornados")
+
+
 class SerieCatalogo(BaseModel):
     """Informações de uma série do catálogo."""
 
@@ -12,13 +12,29 @@ Uso:
 """
 
 import asyncio
+import atexit
+import importlib.util
+import json
 import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
+import numpy as np
 import pandas as pd
 
+try:  # msgspec é opcional: sem ele a resposta da API é lida com json.loads
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
 from bacendata.wrapper import cache, catalogo
 from bacendata.wrapper.exceptions import (
     BacenAPIError,
@@ -37,7 +53,83 @@ MAX_CONCURRENT_REQUESTS = 5
 DEFAULT_TIMEOUT = 30  # segundos
 MAX_RETRIES = 3
 RETRY_BACKOFF = [1, 2, 5]  # segundos entre retries
+RETRY_DEADLINE = 60  # segundos: prazo total de uma requisição, somando os retries
 BACEN_DATE_FORMAT = "%d/%m/%Y"
+# Resolução das datas na versão instalada do pandas (ns no 2.x, us no 3.x)
+_DTYPE_DATA = pd.to_datetime(["01/01/2000"], format=BACEN_DATE_FORMAT).dtype
+# Dias de cada mês (índice 1-12) num ano não bissexto
+_DIAS_NO_MES = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+# Decodificador do corpo JSON das respostas. msgspec.DecodeError é subclasse de
+# ValueError, como o json.JSONDecodeError: o tratamento de erro não muda
+_decodificar_json: Callable[[bytes], Any] = (
+    msgspec.json.Decoder().decode if msgspec is not None else json.loads
+)
+
+# HTTP/2 só se o pacote h2 estiver instalado (extra httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Um cliente HTTP por event loop: o httpx.AsyncClient fica preso ao loop em que
+# foi usado (o loop de fundo do get() síncrono, o da API, o de cada usuário async).
+_clientes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Um semáforo por event loop, compartilhado por todas as consultas do loop: o
+# limite de MAX_CONCURRENT_REQUESTS vale para o processo (ex.: vários usuários
+# da API ao mesmo tempo), não para cada chamada.
+_semaforos: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Retorna o cliente HTTP compartilhado do event loop atual (criado sob demanda).
+
+    Reaproveita conexões keep-alive (e TLS) entre chamadas no mesmo loop,
+    como nas requisições da API.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clientes.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+        )
+        _clientes[loop] = client
+    return client
+
+
+async def fechar_cliente() -> None:
+    """Fecha o cliente HTTP compartilhado do event loop atual, se existir.
+
+    Chamado no shutdown da API e no encerramento do processo (loop de fundo).
+    """
+    client = _clientes.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _get_semaforo() -> asyncio.Semaphore:
+    """Retorna o semáforo global de requisições do event loop atual."""
+    loop = asyncio.get_running_loop()
+    semaforo = _semaforos.get(loop)
+    if semaforo is None:
+        semaforo = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _semaforos[loop] = semaforo
+    return semaforo
+
+
+def _backoff(tentativa: int) -> float:
+    """Espera antes do próximo retry, com jitter para não sincronizar os clientes."""
+    base = RETRY_BACKOFF[min(tentativa, len(RETRY_BACKOFF) - 1)]
+    return base + random.uniform(0, base * 0.25)
+
+
+def _cabe_retry(tentativa: int, backoff: float, prazo: float) -> bool:
+    """Indica se ainda há tentativa e se esperar `backoff` não estoura o prazo (monotônico)."""
+    return tentativa + 1 < MAX_RETRIES and time.monotonic() + backoff < prazo
 
 
 def _parse_date(valor: Union[str, date, datetime, None]) -> Optional[date]:
@@ -51,6 +143,33 @@ def _parse_date(valor: Union[str, date, datetime, None]) -> Optional[date]:
         return valor.date()
     if isinstance(valor, date):
         return valor
+    if not isinstance(valor, str):
+        raise ParametrosInvalidos(
+            f"Data deve ser str, date ou datetime, recebeu {type(valor).__name__}."
+        )
+    return _parse_date_str(valor)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(valor: str) -> date:
+    """Converte uma string de data para date, memoizado.
+
+    As mesmas datas de início/fim se repetem entre chamadas de get().
+    """
+    # Caminho rápido para os dois formatos com zeros à esquerda (o caso comum):
+    # fromisoformat é bem mais barato que strptime
+    if len(valor) == 10:
+        if valor[4] == "-" and valor[7] == "-":
+            iso = valor
+        elif valor[2] == "/" and valor[5] == "/":
+            iso = f"{valor[6:]}-{valor[3:5]}-{valor[:2]}"
+        else:
+            iso = None
+        if iso is not None:
+            try:
+                return date.fromisoformat(iso)
+            except ValueError:
+                pass
     # Tenta ISO primeiro, depois formato brasileiro
     for fmt in ("%Y-%m-%d", "%d/%m/%Y"):
         try:
@@ -60,23 +179,59 @@ def _parse_date(valor: Union[str, date, datetime, None]) -> Optional[date]:
     raise ParametrosInvalidos(f"Formato de data inválido: '{valor}'. Use YYYY-MM-DD ou DD/MM/YYYY.")
 
 
+@lru_cache(maxsize=1024)
 def _gerar_intervalos(
     inicio: date, fim: date, anos_max: int = MAX_YEARS_PER_REQUEST
-) -> List[Tuple[date, date]]:
+) -> Tuple[Tuple[date, date], ...]:
     """Divide um intervalo de datas em chunks de no máximo `anos_max` anos.
 
     Necessário porque a API do BACEN limita consultas a 10 anos desde março/2025.
+    O resultado é memoizado (consultas como "últimos 10 anos" se repetem muito)
+    e por isso é uma tupla imutável.
     """
-    intervalos: List[Tuple[date, date]] = []
-    cursor = inicio
-    while cursor < fim:
-        proximo = min(
-            date(cursor.year + anos_max, cursor.month, cursor.day) - timedelta(days=1),
-            fim,
-        )
-        intervalos.append((cursor, proximo))
-        cursor = proximo + timedelta(days=1)
-    return intervalos
+    # Inícios em ordinais (inicio + k * anos_max anos de calendário); cada
+    # intervalo termina na véspera do seguinte, e o último em `fim`
+    fim_ord = fim.toordinal()
+    limites = [
+        ordinal
+        for k in range((fim.year - inicio.year) // anos_max + 1)
+        if (ordinal := _somar_anos(inicio, k * anos_max).toordinal()) <= fim_ord
+    ]
+    limites.append(fim_ord + 1)
+    return tuple(
+        (date.fromordinal(a), date.fromordinal(b - 1)) for a, b in zip(limites, limites[1:])
+    )
+
+
+def _somar_anos(d: date, anos: int) -> date:
+    """Desloca a data em `anos` anos de calendário (29/02 vira 28/02 se preciso)."""
+    try:
+        return d.replace(year=d.year + anos)
+    except ValueError:  # 29/02 sem correspondente no ano de destino
+        return d.replace(year=d.year + anos, day=28)
+
+
+@lru_cache(maxsize=1024)
+def _url_serie(codigo: int) -> str:
+    """URL de dados da série, memoizada (a mesma série volta a cada intervalo)."""
+    return BASE_URL.format(codigo=codigo)
+
+
+@lru_cache(maxsize=1024)
+def _url_ultimos(codigo: int, n: int) -> str:
+    """URL dos últimos N valores da série, memoizada."""
+    return ULTIMOS_URL.format(codigo=codigo, n=n)
+
+
+@lru_cache(maxsize=4096)
+def _formatar_data(d: date) -> str:
+    """Formata a data no padrão da API (DD/MM/YYYY), memoizado.
+
+    Os limites dos intervalos se repetem entre consultas (ver _gerar_intervalos),
+    então cache hits não pagam a formatação a cada chamada. No miss, os campos
+    são montados direto (layout fixo de BACEN_DATE_FORMAT), sem o strftime.
+    """
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
 
 
 async def _fetch_com_retry(
@@ -90,6 +245,9 @@ async def _fetch_com_retry(
     Retorna lista de dicts com campos 'data' e 'valor' da API.
     """
     last_exception: Optional[Exception] = None
+    # Sem espera depois da última tentativa, nem além do prazo total
+    prazo = time.monotonic() + RETRY_DEADLINE
+    tentativa = 0
     for tentativa in range(MAX_RETRIES):
         try:
             response = await client.get(url, params=params, timeout=DEFAULT_TIMEOUT)
@@ -101,15 +259,19 @@ async def _fetch_com_retry(
                 raise BacenAPIError(400, response.text)
 
             if response.status_code == 429:
-                backoff = RETRY_BACKOFF[min(tentativa, len(RETRY_BACKOFF) - 1)]
-                logger.warning("Rate limit (429) na série %d. Aguardando %ds...", codigo, backoff)
+                backoff = _backoff(tentativa)
+                if not _cabe_retry(tentativa, backoff, prazo):
+                    break
+                logger.warning("Rate limit (429) na série %d. Aguardando %.1fs...", codigo, backoff)
                 await asyncio.sleep(backoff)
                 continue
 
             if response.status_code >= 500:
-                backoff = RETRY_BACKOFF[min(tentativa, len(RETRY_BACKOFF) - 1)]
+                backoff = _backoff(tentativa)
+                if not _cabe_retry(tentativa, backoff, prazo):
+                    break
                 logger.warning(
-                    "Erro %d na série %d. Retry %d/%d em %ds...",
+                    "Erro %d na série %d. Retry %d/%d em %.1fs...",
                     response.status_code,
                     codigo,
                     tentativa + 1,
@@ -121,16 +283,18 @@ async def _fetch_com_retry(
 
             response.raise_for_status()
 
-            dados = response.json()
+            dados = _decodificar_json(response.content)
             if not isinstance(dados, list):
                 return []
             return dados
 
         except httpx.TimeoutException:
             last_exception = BacenTimeoutError(codigo, tentativa + 1)
-            backoff = RETRY_BACKOFF[min(tentativa, len(RETRY_BACKOFF) - 1)]
+            backoff = _backoff(tentativa)
+            if not _cabe_retry(tentativa, backoff, prazo):
+                break
             logger.warning(
-                "Timeout na série %d. Retry %d/%d em %ds...",
+                "Timeout na série %d. Retry %d/%d em %.1fs...",
                 codigo,
                 tentativa + 1,
                 MAX_RETRIES,
@@ -141,12 +305,14 @@ async def _fetch_com_retry(
             raise
         except httpx.HTTPStatusError as e:
             last_exception = BacenAPIError(e.response.status_code, str(e))
-            backoff = RETRY_BACKOFF[min(tentativa, len(RETRY_BACKOFF) - 1)]
+            backoff = _backoff(tentativa)
+            if not _cabe_retry(tentativa, backoff, prazo):
+                break
             await asyncio.sleep(backoff)
 
     if last_exception:
         raise last_exception
-    raise BacenTimeoutError(codigo, MAX_RETRIES)
+    raise BacenTimeoutError(codigo, tentativa + 1)
 
 
 async def _buscar_serie_periodo(
@@ -154,28 +320,36 @@ async def _buscar_serie_periodo(
     codigo: int,
     inicio: date,
     fim: date,
-) -> List[Dict[str, str]]:
-    """Busca uma série para um período específico (máx 10 anos)."""
-    param_inicio = inicio.strftime(BACEN_DATE_FORMAT)
-    param_fim = fim.strftime(BACEN_DATE_FORMAT)
+) -> pd.DataFrame:
+    """Busca uma série para um período específico (máx 10 anos).
+
+    Retorna o DataFrame já convertido; vazio se o período não tiver dados.
+    """
+    param_inicio = _formatar_data(inicio)
+    param_fim = _formatar_data(fim)
 
-    # Tentar cache primeiro
-    dados_cache = cache.obter(codigo, param_inicio, param_fim)
-    if dados_cache is not None:
-        return dados_cache
+    # Tentar cache primeiro (já convertido, sem refazer o parse)
+    df_cache = cache.obter_df(codigo, param_inicio, param_fim)
+    if df_cache is not None:
+        return df_cache
 
-    url = BASE_URL.format(codigo=codigo)
+    url = _url_serie(codigo)
     params = {
         "formato": "json",
         "dataInicial": param_inicio,
         "dataFinal": param_fim,
     }
-    dados = await _fetch_com_retry(client, url, params, codigo)
+    # Semáforo só na ida à rede: cache hits não esperam na fila das requisições
+    async with _get_semaforo():
+        dados = await _fetch_com_retry(client, url, params, codigo)
+    df = _dados_para_dataframe(dados, codigo) if dados else pd.DataFrame(columns=["data", "valor"])
 
-    # Salvar no cache
-    cache.salvar(codigo, param_inicio, param_fim, dados)
+    # Salvar no cache (colunar, a partir do df já parseado): período já
+    # encerrado não muda, então fica bem mais tempo
+    ttl = cache.TTL_HISTORICO if fim < date.today() - timedelta(days=1) else None
+    cache.salvar_df(codigo, param_inicio, param_fim, df, ttl=ttl)
 
-    return dados
+    return df.copy() if cache.esta_ativo() else df
 
 
 async def _buscar_serie_ultimos(
@@ -183,10 +357,70 @@ async def _buscar_serie_ultimos(
     codigo: int,
     n: int,
 ) -> List[Dict[str, str]]:
-    """Busca os últimos N valores de uma série."""
-    url = ULTIMOS_URL.format(codigo=codigo, n=n)
+    """Busca os últimos N valores de uma série (respeitando o semáforo compartilhado)."""
+    url = _url_ultimos(codigo, n)
     params = {"formato": "json"}
-    return await _fetch_com_retry(client, url, params, codigo)
+    async with _get_semaforo():
+        return await _fetch_com_retry(client, url, params, codigo)
+
+
+async def _buscar_intervalo(
+    client: httpx.AsyncClient,
+    codigo: int,
+    inicio: date,
+    fim: date,
+    tolerar_vazio: bool,
+) -> Optional[pd.DataFrame]:
+    """Busca um intervalo (a ida à rede respeita o semáforo compartilhado).
+
+    Retorna o DataFrame do intervalo, ou None se não houver dados. Com
+    `tolerar_vazio`, um intervalo inexistente (série começou depois deste
+    período) também retorna None em vez de propagar o erro.
+    """
+    try:
+        df = await _buscar_serie_periodo(client, codigo, inicio, fim)
+    except (SerieNaoEncontrada, BacenAPIError):
+        if not tolerar_vazio:
+            raise
+        logger.debug("Sem dados para série %d no período %s a %s", codigo, inicio, fim)
+        return None
+    return df if not df.empty else None
+
+
+def _concatenar_intervalos(dfs: List[Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+    """Concatena os DataFrames dos intervalos uma única vez, sem datas repetidas.
+
+    Retorna None se nenhum intervalo tiver dados.
+    """
+    dfs_validos = [df for df in dfs if df is not None]
+    if not dfs_validos:
+        return None
+    if len(dfs_validos) == 1:
+        return dfs_validos[0]
+    df = pd.concat(dfs_validos)
+    # Intervalos disjuntos e em ordem (o caso normal): nada a deduplicar/ordenar
+    if df.index.is_monotonic_increasing and df.index.is_unique:
+        return df
+    return df[~df.index.duplicated(keep="first")].sort_index()
+
+
+def _intervalos_do_periodo(
+    inicio: Optional[date], fim: Optional[date]
+) -> Tuple[Tuple[date, date], ...]:
+    """Aplica o período padrão (últimos 10 anos), valida e divide em intervalos.
+
+    Compartilhado por consultas de uma e de múltiplas séries.
+    """
+    if fim is None:
+        fim = date.today()
+    if inicio is None:
+        inicio = _somar_anos(fim, -10 + 1)
+
+    if inicio > fim:
+        raise ParametrosInvalidos(
+            f"Data inicial ({inicio}) não pode ser posterior à data final ({fim})."
+        )
+    return _gerar_intervalos(inicio, fim)
 
 
 async def _buscar_serie_completa(
@@ -194,61 +428,47 @@ async def _buscar_serie_completa(
     inicio: Optional[date] = None,
     fim: Optional[date] = None,
     last: Optional[int] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> pd.DataFrame:
     """Busca uma série completa com paginação automática se necessário.
 
     Se o intervalo for superior a 10 anos, divide em chunks e faz
     requisições paralelas (máximo 5 simultâneas).
-    """
-    async with httpx.AsyncClient() as client:
-        # Caso: últimos N valores
-        if last is not None:
-            dados = await _buscar_serie_ultimos(client, codigo, last)
-            return _dados_para_dataframe(dados, codigo)
-
-        # Definir período padrão
-        if fim is None:
-            fim = date.today()
-        if inicio is None:
-            inicio = date(fim.year - 10 + 1, fim.month, fim.day)
-
-        # Validação
-        if inicio > fim:
-            raise ParametrosInvalidos(
-                f"Data inicial ({inicio}) não pode ser posterior à data final ({fim})."
-            )
-
-        # Gerar intervalos de no máximo 10 anos
-        intervalos = _gerar_intervalos(inicio, fim)
 
-        if len(intervalos) == 1:
-            dados = await _buscar_serie_periodo(client, codigo, inicio, fim)
-            return _dados_para_dataframe(dados, codigo)
-
-        # Múltiplos intervalos: requisições paralelas com semáforo
-        semaforo = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
-        async def fetch_com_semaforo(ini: date, fi: date) -> List[Dict[str, str]]:
-            async with semaforo:
-                try:
-                    return await _buscar_serie_periodo(client, codigo, ini, fi)
-                except (SerieNaoEncontrada, BacenAPIError):
-                    # Intervalo pode não ter dados (série começou depois deste período)
-                    logger.debug("Sem dados para série %d no período %s a %s", codigo, ini, fi)
-                    return []
-
-        tarefas = [fetch_com_semaforo(ini, fi) for ini, fi in intervalos]
+    Se `client` não for informado, usa o cliente compartilhado do event loop.
+    """
+    if client is None:
+        client = _get_client()
+
+    # Caso: últimos N valores
+    if last is not None:
+        dados = await _buscar_serie_ultimos(client, codigo, last)
+        return _dados_para_dataframe(dados, codigo)
+
+    # Período padrão, validação e intervalos de no máximo 10 anos
+    intervalos = _intervalos_do_periodo(inicio, fim)
+
+    if len(intervalos) == 1:
+        # Caminho direto, sem gather nem tarefas: o caso comum (< 10 anos)
+        ini, fi = intervalos[0]
+        df = await _buscar_serie_periodo(client, codigo, ini, fi)
+        if df.empty:
+            logger.warning("Série %d retornou dados vazios.", codigo)
+        return df
+
+    # Múltiplos intervalos: requisições paralelas limitadas pelo semáforo global
+    tarefas = [
+        _buscar_intervalo(client, codigo, ini, fi, tolerar_vazio=True) for ini, fi in intervalos
+    ]
+    # Escritas no cache dos intervalos num único commit
+    with cache.lote():
         resultados = await asyncio.gather(*tarefas)
 
-        # Concatenar e deduplicar
-        todos_dados: List[Dict[str, str]] = []
-        for resultado in resultados:
-            todos_dados.extend(resultado)
-
-        if not todos_dados:
-            raise SerieNaoEncontrada(codigo)
-
-        return _dados_para_dataframe(todos_dados, codigo)
+    # Concatenar e deduplicar
+    df = _concatenar_intervalos(resultados)
+    if df is None:
+        raise SerieNaoEncontrada(codigo)
+    return df
 
 
 def _dados_para_dataframe(dados: List[Dict[str, str]], codigo: int) -> pd.DataFrame:
@@ -260,21 +480,83 @@ def _dados_para_dataframe(dados: List[Dict[str, str]], codigo: int) -> pd.DataFr
         logger.warning("Série %d retornou dados vazios.", codigo)
         return pd.DataFrame(columns=["data", "valor"])
 
-    df = pd.DataFrame(dados)
+    # Colunas extraídas direto das dicts, sem DataFrame intermediário de objetos
+    return _colunas_para_dataframe([d["data"] for d in dados], [d.get("valor") for d in dados])
+
 
-    # Converter data para datetime
-    df["data"] = pd.to_datetime(df["data"], format=BACEN_DATE_FORMAT, dayfirst=True)
+def _parse_datas_bacen(datas_str: List[str]) -> Optional[np.ndarray]:
+    """Converte datas "DD/MM/YYYY" em datetime64 pelas posições fixas dos dígitos.
 
-    # Converter valor para float
-    df["valor"] = pd.to_numeric(df["valor"], errors="coerce")
+    Os bytes de todas as datas viram uma matriz N×10 e dia, mês e ano saem por
+    aritmética vetorizada, sem parse linha a linha. Retorna None se alguma
+    data fugir do layout (ou for inválida), para o chamador usar o parse geral.
+    """
+    if not datas_str or set(map(len, datas_str)) != {10}:
+        return None
+    try:
+        brutos = "".join(datas_str).encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    matriz = np.frombuffer(brutos, dtype=np.uint8).reshape(-1, 10)
+    if not ((matriz[:, 2] == ord("/")) & (matriz[:, 5] == ord("/"))).all():
+        return None
+    digitos = matriz[:, [0, 1, 3, 4, 6, 7, 8, 9]].astype(np.int64) - ord("0")
+    if not ((digitos >= 0) & (digitos <= 9)).all():
+        return None
 
-    # Remover duplicatas e ordenar
-    df = df.drop_duplicates(subset=["data"]).sort_values("data").reset_index(drop=True)
+    dia = digitos[:, 0] * 10 + digitos[:, 1]
+    mes = digitos[:, 2] * 10 + digitos[:, 3]
+    ano = digitos[:, 4] * 1000 + digitos[:, 5] * 100 + digitos[:, 6] * 10 + digitos[:, 7]
+    # Anos limitados à faixa que cabe em datetime64[ns] (pandas 2.x)
+    if not ((mes >= 1) & (mes <= 12) & (ano >= 1678) & (ano <= 2261)).all():
+        return None
+    bissexto = (ano % 4 == 0) & ((ano % 100 != 0) | (ano % 400 == 0))
+    if not ((dia >= 1) & (dia <= _DIAS_NO_MES[mes] + (bissexto & (mes == 2)))).all():
+        return None
 
-    # Definir data como índice
-    df = df.set_index("data")
+    # Dias desde 1970-01-01 (algoritmo days_from_civil, no calendário gregoriano)
+    a = ano - (mes <= 2)
+    era = a // 400
+    ano_da_era = a - era * 400
+    dia_do_ano = (153 * np.where(mes > 2, mes - 3, mes + 9) + 2) // 5 + dia - 1
+    dia_da_era = ano_da_era * 365 + ano_da_era // 4 - ano_da_era // 100 + dia_do_ano
+    return (era * 146097 + dia_da_era - 719468).astype("datetime64[D]").astype(_DTYPE_DATA)
 
-    return df
+
+def _parse_valores(valores_str: List[Optional[str]]) -> np.ndarray:
+    """Converte os valores (texto) da API em float64; ausentes ou não numéricos viram NaN."""
+    try:
+        # Caso comum: strings decimais com "." parseadas num único loop em C
+        return np.asarray(valores_str, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+    try:
+        # Só None ou "" entre os valores: troca por "nan" e continua no loop em C
+        return np.asarray([v or "nan" for v in valores_str], dtype=np.float64)
+    except (TypeError, ValueError):
+        # Outros não numéricos (ex: "-"): parse geral, elemento a elemento
+        return pd.to_numeric(pd.Series(valores_str), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _colunas_para_dataframe(datas_str: List[str], valores_str: List[Optional[str]]) -> pd.DataFrame:
+    """Monta o DataFrame a partir das colunas de datas (DD/MM/YYYY) e valores (texto)."""
+    datas = _parse_datas_bacen(datas_str)
+    if datas is None:
+        # Fora do layout fixo: o parse geral do pandas (e o seu erro, se inválida)
+        datas = pd.to_datetime(
+            datas_str, format=BACEN_DATE_FORMAT, exact=True, cache=True
+        ).to_numpy()
+    valores = _parse_valores(valores_str)
+
+    # A API já devolve em ordem estritamente crescente: só deduplica/ordena se
+    # não vier assim, nos arrays, antes de montar o DataFrame
+    if not (datas[1:] > datas[:-1]).all():
+        # Índices, em ordem de data, da primeira ocorrência de cada data
+        _, primeiras = np.unique(datas.view(np.int64), return_index=True)
+        datas = datas[primeiras]
+        valores = valores[primeiras]
+
+    return pd.DataFrame({"valor": valores}, index=pd.DatetimeIndex(datas, name="data"))
 
 
 async def _buscar_multiplas_series(
@@ -291,27 +573,45 @@ async def _buscar_multiplas_series(
         fim: Data final (opcional)
         last: Últimos N valores (opcional, sobrepõe inicio/fim)
     """
-    fim_parsed = _parse_date(fim) if isinstance(fim, str) else fim
-    inicio_parsed = _parse_date(inicio) if isinstance(inicio, str) else inicio
-
-    if fim_parsed is None and last is None:
-        fim_parsed = date.today()
-    if inicio_parsed is None and last is None:
-        fim_parsed = fim_parsed or date.today()
-        inicio_parsed = date(fim_parsed.year - 10 + 1, fim_parsed.month, fim_parsed.day)
-
-    # Buscar cada série
-    semaforo = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
-    async def fetch_serie(nome: str, codigo: int) -> Tuple[str, pd.DataFrame]:
-        async with semaforo:
-            df = await _buscar_serie_completa(
-                codigo, inicio=inicio_parsed, fim=fim_parsed, last=last
-            )
-            return nome, df
-
-    tarefas = [fetch_serie(nome, codigo) for nome, codigo in series.items()]
-    resultados = await asyncio.gather(*tarefas)
+    # Todas as requisições (séries × intervalos) vão num único gather, limitadas
+    # pelo semáforo global: a concorrência fica saturada qualquer que seja a consulta
+    client = _get_client()
+    nomes = list(series)
+
+    if last is not None:
+        brutos = await asyncio.gather(
+            *(_buscar_serie_ultimos(client, series[nome], last) for nome in nomes)
+        )
+        resultados = [
+            (nome, _dados_para_dataframe(dados, series[nome])) for nome, dados in zip(nomes, brutos)
+        ]
+    else:
+        # Período resolvido e dividido uma única vez para todas as séries
+        intervalos = _intervalos_do_periodo(_parse_date(inicio), _parse_date(fim))
+        # Com um só intervalo, erro da série propaga (como em _buscar_serie_completa)
+        tolerar_vazio = len(intervalos) > 1
+        tarefas = [
+            (nome, _buscar_intervalo(client, series[nome], ini, fi, tolerar_vazio))
+            for nome in nomes
+            for ini, fi in intervalos
+        ]
+        # Escritas no cache de todas as séries × intervalos num único commit
+        with cache.lote():
+            brutos = await asyncio.gather(*(tarefa for _, tarefa in tarefas))
+
+        # Reagrupar os intervalos por série
+        por_serie: Dict[str, List[Optional[pd.DataFrame]]] = defaultdict(list)
+        for (nome, _), df_intervalo in zip(tarefas, brutos):
+            por_serie[nome].append(df_intervalo)
+
+        resultados = []
+        for nome in nomes:
+            df = _concatenar_intervalos(por_serie[nome])
+            if df is None:
+                if tolerar_vazio:
+                    raise SerieNaoEncontrada(series[nome])
+                df = _dados_para_dataframe([], series[nome])
+            resultados.append((nome, df))
 
     # Combinar em um único DataFrame
     dfs: Dict[str, pd.Series] = {}
@@ -327,24 +627,71 @@ async def _buscar_multiplas_series(
     return resultado.sort_index()
 
 
+# Event loop persistente, numa thread daemon, para as funções síncronas: get()
+# e metadata() reaproveitam entre chamadas o mesmo loop e, com ele, o mesmo
+# cliente HTTP (pool de conexões, TLS, semáforo).
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Retorna o loop de fundo, iniciando a thread na primeira chamada."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="bacendata-loop", daemon=True).start()
+        return _loop
+
+
+def _encerrar_loop() -> None:
+    """Fecha o cliente HTTP e para o loop de fundo (no encerramento do processo)."""
+    global _loop
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(fechar_cliente(), loop).result(timeout=5)
+    except Exception:  # pragma: no cover - best effort no shutdown
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def _resetar_loop_no_fork() -> None:
+    """No processo filho a thread do loop não existe: força criar um loop novo."""
+    global _loop, _loop_lock
+    _loop = None
+    _loop_lock = threading.Lock()
+
+
+atexit.register(_encerrar_loop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_resetar_loop_no_fork)
+
+
 def _run_async(coro):  # type: ignore[no-untyped-def]
-    """Executa coroutine de forma compatível com ambientes sync e async.
+    """Executa a coroutine no loop de fundo e aguarda o resultado.
 
-    Trata o caso de já existir um event loop rodando (ex: Jupyter notebooks).
+    Funciona igual com ou sem um event loop já rodando (ex: Jupyter notebooks),
+    pois a coroutine nunca roda no loop de quem chamou.
     """
+    loop = _get_loop()
     try:
-        loop = asyncio.get_running_loop()
+        atual = asyncio.get_running_loop()
     except RuntimeError:
-        loop = None
+        atual = None
+    if atual is loop:
+        coro.close()
+        raise RuntimeError("Chamada síncrona dentro do loop do bacendata; use aget()/ametadata().")
 
-    if loop and loop.is_running():
-        # Dentro de um event loop existente (Jupyter, etc.)
-        import nest_asyncio
-
-        nest_asyncio.apply()
-        return loop.run_until_complete(coro)
-    else:
-        return asyncio.run(coro)
+    futuro = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return futuro.result()
+    except BaseException:
+        # Ex: KeyboardInterrupt enquanto aguarda — não deixa a busca rodando no fundo
+        futuro.cancel()
+        raise
 
 
 def get(
@@ -444,69 +791,82 @@ def metadata(codigo: int) -> Dict[str, Union[str, int, None]]:
 
 async def ametadata(codigo: int) -> Dict[str, Union[str, int, None]]:
     """Versão async de metadata(). Para uso em contextos assíncronos (FastAPI, etc)."""
-    metadata_url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.{codigo}"
+    client = _get_client()
 
-    async with httpx.AsyncClient() as client:
-        # A API SGS não tem endpoint dedicado de metadados no formato JSON.
-        # Fazemos uma requisição com último valor para validar a série,
-        # e depois buscamos os metadados via endpoint XML/HTML.
-        ultimos_url = ULTIMOS_URL.format(codigo=codigo, n=1)
-        params = {"formato": "json"}
+    # Endpoint de metadados primeiro: quando responde, a série existe e basta
+    # uma requisição
+    info = await _buscar_metadados(client, codigo)
+    if info is not None:
+        return info
 
-        try:
-            response = await client.get(ultimos_url, params=params, timeout=DEFAULT_TIMEOUT)
-        except httpx.TimeoutException:
-            raise BacenTimeoutError(codigo, 1)
+    # A API SGS nem sempre responde metadados em JSON (e um 404 ali não prova
+    # que a série não existe): valida a série pelo último valor
+    ultimos_url = _url_ultimos(codigo, 1)
+    params = {"formato": "json"}
 
-        if response.status_code == 404:
-            raise SerieNaoEncontrada(codigo)
+    try:
+        response = await client.get(ultimos_url, params=params, timeout=DEFAULT_TIMEOUT)
+    except httpx.TimeoutException:
+        raise BacenTimeoutError(codigo, 1)
+
+    if response.status_code == 404:
+        raise SerieNaoEncontrada(codigo)
+
+    if response.status_code >= 400:
+        raise BacenAPIError(response.status_code, response.text)
+
+    # Fallback: retornar dados mínimos
+    return {
+        "codigo": codigo,
+        "nome": None,
+        "unidade": None,
+        "periodicidade": None,
+        "fonte": None,
+        "inicio": None,
+        "fim": None,
+    }
 
-        if response.status_code >= 400:
-            raise BacenAPIError(response.status_code, response.text)
 
-        # Buscar metadados via endpoint principal (retorna HTML/XML)
-        try:
-            meta_response = await client.get(
-                metadata_url,
-                params={"formato": "json"},
-                timeout=DEFAULT_TIMEOUT,
-            )
-            if meta_response.status_code == 200:
-                try:
-                    meta_data = meta_response.json()
-                    return {
-                        "codigo": codigo,
-                        "nome": meta_data.get("nomeCompleto") or meta_data.get("nome"),
-                        "unidade": (
-                            meta_data.get("unidadePadrao", {}).get("nome")
-                            if isinstance(meta_data.get("unidadePadrao"), dict)
-                            else meta_data.get("unidadePadrao")
-                        ),
-                        "periodicidade": (
-                            meta_data.get("periodicidade", {}).get("nome")
-                            if isinstance(meta_data.get("periodicidade"), dict)
-                            else meta_data.get("periodicidade")
-                        ),
-                        "fonte": (
-                            meta_data.get("gestorProprietario", {}).get("nome")
-                            if isinstance(meta_data.get("gestorProprietario"), dict)
-                            else meta_data.get("gestorProprietario")
-                        ),
-                        "inicio": meta_data.get("dataInicio"),
-                        "fim": meta_data.get("dataFim"),
-                    }
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        # Fallback: retornar dados mínimos
+async def _buscar_metadados(
+    client: httpx.AsyncClient, codigo: int
+) -> Optional[Dict[str, Union[str, int, None]]]:
+    """Busca os metadados no endpoint principal da série; None se não vierem em JSON.
+
+    Timeout não cai no fallback: propaga como BacenTimeoutError, para metadata()
+    não esperar dois timeouts seguidos.
+    """
+    metadata_url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.{codigo}"
+    try:
+        meta_response = await client.get(
+            metadata_url,
+            params={"formato": "json"},
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if meta_response.status_code != 200:
+            return None
+        meta_data = _decodificar_json(meta_response.content)
         return {
             "codigo": codigo,
-            "nome": None,
-            "unidade": None,
-            "periodicidade": None,
-            "fonte": None,
-            "inicio": None,
-            "fim": None,
+            "nome": meta_data.get("nomeCompleto") or meta_data.get("nome"),
+            "unidade": (
+                meta_data.get("unidadePadrao", {}).get("nome")
+                if isinstance(meta_data.get("unidadePadrao"), dict)
+                else meta_data.get("unidadePadrao")
+            ),
+            "periodicidade": (
+                meta_data.get("periodicidade", {}).get("nome")
+                if isinstance(meta_data.get("periodicidade"), dict)
+                else meta_data.get("periodicidade")
+            ),
+            "fonte": (
+                meta_data.get("gestorProprietario", {}).get("nome")
+                if isinstance(meta_data.get("gestorProprietario"), dict)
+                else meta_data.get("gestorProprietario")
+            ),
+            "inicio": meta_data.get("dataInicio"),
+            "fim": meta_data.get("dataFim"),
         }
+    except httpx.TimeoutException:
+        raise BacenTimeoutError(codigo, 1)
+    except (httpx.HTTPError, ValueError, AttributeError):
+        return None
@@ -10,6 +10,15 @@ por periodicidade da série:
     - Séries semanais: 6 horas
     - Séries mensais: 24 horas
 
+Períodos já encerrados (que terminam antes de ontem) usam TTL_HISTORICO,
+bem mais longo: só o trecho mais recente de uma série volta à API.
+
+Na frente do SQLite há uma camada em memória (LRU) com os DataFrames já
+convertidos, para que cache hits não refaçam o parse.
+
+Entradas expiradas são removidas por uma thread em segundo plano, a cada
+INTERVALO_COLETA segundos, fora do caminho das consultas.
+
 Uso:
     >>> from bacendata import sgs
     >>> sgs.cache.ativar()  # Ativa cache em ~/.bacendata/cache.db
@@ -17,12 +26,21 @@ Uso:
     >>> selic = sgs.get(11, start="2020-01-01")  # Segunda vez: lê do cache
 """
 
-import json
 import logging
+import os
 import sqlite3
+import struct
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger("bacendata")
 
@@ -33,33 +51,288 @@ TTL_PADRAO: Dict[str, int] = {
     "mensal": 86400,  # 24 horas
 }
 TTL_DEFAULT = 3600  # 1 hora para séries sem periodicidade conhecida
+# Períodos encerrados praticamente não mudam; o TTL finito ainda pega revisões
+TTL_HISTORICO = 30 * 86400  # 30 dias
 
 _CACHE_DIR = Path.home() / ".bacendata"
 _CACHE_DB = _CACHE_DIR / "cache.db"
 
+# SQL fixo em constantes, reaproveitado pelo cache de statements preparados da
+# conexão (chaveado pelo texto): cada consulta é compilada uma única vez
+# Colunas fixas antes do payload: ler a validade não passa pelas páginas de
+# overflow do BLOB de séries longas
+_COLUNAS = ["chave", "timestamp", "expires_at", "dados"]
+_SQL_SELECT_VALIDADE = "SELECT timestamp, expires_at FROM cache_series WHERE chave = ?"
+_SQL_SELECT_DADOS = "SELECT dados FROM cache_series WHERE chave = ?"
+_SQL_INSERT = (
+    "INSERT OR REPLACE INTO cache_series (chave, timestamp, expires_at, dados) "
+    "VALUES (?, ?, ?, ?)"
+)
+_SQL_DELETE_EXPIRADOS = "DELETE FROM cache_series WHERE expires_at < ?"
+_SQL_DELETE_TODOS = "DELETE FROM cache_series"
+_CACHED_STATEMENTS = 256
+# auto_vacuum=INCREMENTAL (valor 2 no PRAGMA): páginas liberadas por DELETEs
+# voltam ao sistema com incremental_vacuum, sem reescrever o arquivo inteiro
+_AUTO_VACUUM_INCREMENTAL = 2
+# Só compacta depois de limpezas que removeram ao menos isso de entradas
+_LIMIAR_COMPACTAR = 100
+# Intervalo (em segundos) da limpeza de expirados em segundo plano
+INTERVALO_COLETA = 600  # 10 minutos
+
+# Payload colunar (SoA): cabeçalho de 16 bytes (mágico, n, tipo dos valores,
+# escala decimal, reservado), seguido do bloco de valores e das datas em int32
+# (dias desde 1970-01-01). O cabeçalho alinha os blocos, lidos direto com np.frombuffer
+_MAGICO = b"BCD1"
+_CABECALHO = struct.Struct("<4sIBB6x")
+_FORMATO_DATA = "%d/%m/%Y"
+# Resolução das datas na versão instalada do pandas (ns no 2.x, us no 3.x)
+_DTYPE_DATA = pd.to_datetime(["01/01/2000"], format=_FORMATO_DATA).dtype
+
+# Tipos do bloco de valores: float64 (NaN = ausente) ou int32 com escala
+# decimal (valor = inteiro / 10**escala; _INT32_AUSENTE = ausente). A escala é
+# escolhida por série e só é usada se a volta for exata, bit a bit
+_VALORES_FLOAT64 = 0
+_VALORES_INT32 = 1
+_INT32_AUSENTE = np.iinfo(np.int32).min
+_INT32_LIMITE = np.iinfo(np.int32).max
+_ESCALA_MAXIMA = 4
+
+
+def _vazio() -> pd.DataFrame:
+    return pd.DataFrame(columns=["data", "valor"])
+
+
+def _quantizar(valores: np.ndarray) -> Optional[Tuple[np.ndarray, int]]:
+    """Tenta representar os valores como int32 × 10**-escala sem perda alguma.
+
+    Returns:
+        (inteiros, escala), ou None se nenhuma escala até _ESCALA_MAXIMA serve.
+    """
+    presentes = ~np.isnan(valores)
+    amostra = valores[presentes]
+    for escala in range(_ESCALA_MAXIMA + 1):
+        fator = 10.0**escala
+        inteiros = np.round(amostra * fator)
+        if inteiros.size and np.abs(inteiros).max() > _INT32_LIMITE:
+            return None  # Escalas maiores só aumentam os inteiros
+        if np.array_equal(inteiros / fator, amostra):
+            saida = np.full(valores.shape, _INT32_AUSENTE, dtype=np.int32)
+            saida[presentes] = inteiros
+            return saida, escala
+    return None
+
+
+def _codificar(df: pd.DataFrame) -> bytes:
+    """Serializa um DataFrame (índice de datas, coluna valor) no payload colunar."""
+    n = len(df)
+    if n == 0:
+        return _CABECALHO.pack(_MAGICO, 0, _VALORES_FLOAT64, 0)
+    valores = df["valor"].to_numpy(dtype=np.float64)
+    dias = df.index.to_numpy().astype("datetime64[D]").astype(np.int32)
+    quantizado = _quantizar(valores)
+    if quantizado is None:
+        cabecalho = _CABECALHO.pack(_MAGICO, n, _VALORES_FLOAT64, 0)
+        return cabecalho + valores.tobytes() + dias.tobytes()
+    inteiros, escala = quantizado
+    cabecalho = _CABECALHO.pack(_MAGICO, n, _VALORES_INT32, escala)
+    return cabecalho + inteiros.tobytes() + dias.tobytes()
+
+
+def _decodificar(payload: bytes) -> Optional[pd.DataFrame]:
+    """Reconstrói o DataFrame do payload colunar; None se o formato não for reconhecido."""
+    if len(payload) < _CABECALHO.size or payload[:4] != _MAGICO:
+        return None
+    _, n, tipo, escala = _CABECALHO.unpack_from(payload)
+    if n == 0:
+        return _vazio()
+    offset = _CABECALHO.size
+    if tipo == _VALORES_FLOAT64:
+        valores = np.frombuffer(payload, dtype=np.float64, count=n, offset=offset).copy()
+        offset += 8 * n
+    elif tipo == _VALORES_INT32:
+        inteiros = np.frombuffer(payload, dtype=np.int32, count=n, offset=offset)
+        valores = inteiros / 10.0**escala
+        valores[inteiros == _INT32_AUSENTE] = np.nan
+        offset += 4 * n
+    else:
+        return None
+    dias = np.frombuffer(payload, dtype=np.int32, count=n, offset=offset)
+    datas = dias.astype("datetime64[D]").astype(_DTYPE_DATA)
+    return pd.DataFrame({"valor": valores}, index=pd.DatetimeIndex(datas, name="data"))
+
+
+def _registros_para_df(dados: List[Dict[str, str]]) -> pd.DataFrame:
+    """Converte registros no formato da API ({"data", "valor"}) para DataFrame."""
+    if not dados:
+        return _vazio()
+    datas = pd.to_datetime([d["data"] for d in dados], format=_FORMATO_DATA)
+    valores = pd.to_numeric(pd.Series([d.get("valor") for d in dados]), errors="coerce")
+    return pd.DataFrame(
+        {"valor": valores.to_numpy(dtype=np.float64)},
+        index=pd.DatetimeIndex(datas, name="data"),
+    )
+
+
+def _df_para_registros(df: pd.DataFrame) -> List[Dict[str, str]]:
+    """Volta do DataFrame para registros no formato da API (valor ausente = "")."""
+    if df.empty:
+        return []
+    datas = df.index.strftime(_FORMATO_DATA)
+    return [
+        {"data": data, "valor": "" if valor != valor else repr(valor)}
+        for data, valor in zip(datas, df["valor"].tolist())
+    ]
+
+
+# Máximo de DataFrames mantidos na camada em memória
+MAX_DFS_MEMORIA = 256
+
 # Estado global do cache
 _ativo = False
-_conn: Optional[sqlite3.Connection] = None
+# Uma conexão por thread (e por processo): com WAL, threads leem em paralelo
+# sem disputar o mutex de uma conexão única, e um processo filho (fork) nunca
+# usa a conexão herdada do pai
+_tls = threading.local()
+# Incrementada em ativar/desativar: conexões de gerações anteriores são trocadas
+_geracao = 0
+# Serializa as escritas entre threads (evita SQLITE_BUSY entre as conexões)
+_lock = threading.RLock()
+# Linha gravada no SQLite: (chave, timestamp, expires_at, dados)
+_Linha = Tuple[str, float, float, bytes]
+# Lote atual, ver lote().
+# ContextVar: tarefas asyncio criadas dentro do lote herdam o mesmo objeto.
+_lote: "ContextVar[Optional[_Lote]]" = ContextVar("bacendata_cache_lote", default=None)
+# Chave da camada em memória: (codigo, param_inicio, param_fim). A tupla evita
+# montar a string do SQLite, que só é gerada quando a consulta chega ao banco
+_Chave = Tuple[int, str, str]
+# {chave: (DataFrame, expira_em)} em ordem LRU
+_dfs: "OrderedDict[_Chave, Tuple[pd.DataFrame, float]]" = OrderedDict()
+# Protege _dfs: a thread de coleta remove entradas enquanto outras threads leem.
+# Separado de _lock para uma leitura em memória não esperar escritas no SQLite
+_lock_dfs = threading.Lock()
+# Thread de limpeza em segundo plano e o evento que a encerra, ver _iniciar_coletor()
+_coletor: Optional[Tuple[threading.Thread, threading.Event]] = None
+
+
+class _Conexao:
+    """Conexão da thread, com o PID e a geração em que foi aberta.
+
+    Um objeto Python comum (aceita weakref, ao contrário de sqlite3.Connection):
+    quando a thread termina, o holder é coletado e a conexão fechada.
+    """
+
+    __slots__ = ("conn", "pid", "geracao", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, pid: int, geracao: int) -> None:
+        self.conn = conn
+        self.pid = pid
+        self.geracao = geracao
+
+
+class _Lote:
+    """Linhas pendentes de um bloco lote(), gravadas num único commit ao sair.
+
+    Depois de fechado, escritas que ainda cheguem (ex: tarefas irmãs de um gather
+    que falhou) vão direto ao SQLite em vez de ficar numa lista já gravada.
+    """
+
+    __slots__ = ("linhas", "aberto")
+
+    def __init__(self) -> None:
+        self.linhas: List[_Linha] = []
+        self.aberto = True
+
+
+# Conexões vivas de todas as threads, para desativar() poder fechá-las
+_conexoes: "weakref.WeakSet[_Conexao]" = weakref.WeakSet()
 
 
 def _get_conn() -> sqlite3.Connection:
-    """Retorna conexão com o banco SQLite, criando tabela se necessário."""
-    global _conn
-    if _conn is not None:
-        return _conn
+    """Retorna a conexão SQLite da thread atual, criando tabela se necessário."""
+    atual: Optional[_Conexao] = getattr(_tls, "conexao", None)
+    if atual is not None and atual.pid == os.getpid() and atual.geracao == _geracao:
+        return atual.conn
 
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    _conn = sqlite3.connect(str(_CACHE_DB))
-    _conn.execute("""
+    # check_same_thread=False só para desativar() poder fechar a partir de outra thread
+    conn = sqlite3.connect(
+        str(_CACHE_DB), check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+    )
+    # WAL: leituras não bloqueiam durante escritas; synchronous=NORMAL dispensa
+    # um fsync por commit (seguro em WAL, no pior caso perde-se o último commit)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-64000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA busy_timeout=5000;
+        PRAGMA mmap_size=268435456;
+        """)
+    with _lock:
+        _criar_schema(conn)
+        conexao = _Conexao(conn, os.getpid(), _geracao)
+        _conexoes.add(conexao)
+    _tls.conexao = conexao
+    return conn
+
+
+def _fechar_conexoes() -> None:
+    """Fecha as conexões de todas as threads e invalida as referências a elas."""
+    global _geracao
+    with _lock:
+        _geracao += 1
+        for conexao in list(_conexoes):
+            if conexao.pid != os.getpid():
+                continue  # Herdada do processo pai: não é nossa para fechar
+            try:
+                conexao.conn.close()
+            except Exception:
+                pass
+        _conexoes.clear()
+
+
+def _criar_schema(conn: sqlite3.Connection) -> None:
+    """Cria a tabela do cache, recriando-a se estiver no schema antigo.
+
+    `expires_at` é gravado no salvar e indexado: a limpeza de expirados vira
+    um range scan no índice, sem calcular timestamp + ttl linha a linha.
+    """
+    colunas = [row[1] for row in conn.execute("PRAGMA table_info(cache_series)")]
+    if colunas and colunas != _COLUNAS:
+        # Schema antigo (ex: dados TEXT + ttl): o cache é descartável, basta recriar
+        logger.info("Cache: schema antigo detectado, recriando tabela.")
+        conn.execute("DROP TABLE cache_series")
+    if not colunas or colunas != _COLUNAS:
+        # Banco novo (ou recém-esvaziado): converter para auto_vacuum sai barato
+        _compactar(conn, converter=True)
+
+    conn.executescript("""
         CREATE TABLE IF NOT EXISTS cache_series (
             chave TEXT PRIMARY KEY,
-            dados TEXT NOT NULL,
             timestamp REAL NOT NULL,
-            ttl INTEGER NOT NULL
-        )
+            expires_at REAL NOT NULL,
+            dados BLOB NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_cache_series_expires_at ON cache_series (expires_at);
         """)
-    _conn.commit()
-    return _conn
+    conn.commit()
+
+
+def _compactar(conn: sqlite3.Connection, converter: bool = False) -> None:
+    """Devolve ao sistema as páginas livres deixadas pelos DELETEs, encolhendo o arquivo.
+
+    Bancos sem auto_vacuum incremental (criados por versões antigas) só são
+    convertidos com `converter`: exige um VACUUM completo, barato apenas
+    quando o cache está vazio.
+    """
+    modo = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if modo == _AUTO_VACUUM_INCREMENTAL:
+        # Cada passo do statement libera uma página, e o execute() do sqlite3 só
+        # dá o primeiro (o PRAGMA não devolve linhas); executescript vai até o fim
+        conn.executescript("PRAGMA incremental_vacuum;")
+    elif converter:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
 
 
 def ativar(caminho: Optional[str] = None) -> None:
@@ -69,29 +342,87 @@ def ativar(caminho: Optional[str] = None) -> None:
         caminho: Caminho customizado para o arquivo .db.
             Se omitido, usa ~/.bacendata/cache.db
     """
-    global _ativo, _conn, _CACHE_DB
+    global _ativo, _CACHE_DB
 
     if caminho:
         _CACHE_DB = Path(caminho)
 
-    _conn = None  # Força reconexão no próximo acesso
+    _parar_coletor()
+    _fechar_conexoes()  # Força reconexão (no caminho novo) no próximo acesso
+    with _lock_dfs:
+        _dfs.clear()
     _ativo = True
+    _iniciar_coletor()
     logger.info("Cache local ativado em %s", _CACHE_DB)
 
 
 def desativar() -> None:
     """Desativa o cache local."""
-    global _ativo, _conn
-    if _conn is not None:
-        try:
-            _conn.close()
-        except Exception:
-            pass
-        _conn = None
+    global _ativo
+    _parar_coletor()
+    _fechar_conexoes()
+    with _lock_dfs:
+        _dfs.clear()
     _ativo = False
     logger.info("Cache local desativado.")
 
 
+def _iniciar_coletor() -> None:
+    """Inicia a thread que remove entradas expiradas a cada INTERVALO_COLETA.
+
+    Assim a limpeza (DELETE, compactação e checkpoint do WAL) nunca roda dentro
+    de uma consulta: leituras só ignoram entradas expiradas.
+    """
+    global _coletor
+    parar = threading.Event()
+    thread = threading.Thread(
+        target=_executar_coletor, args=(parar,), name="bacendata-cache-gc", daemon=True
+    )
+    thread.start()
+    _coletor = (thread, parar)
+
+
+def _parar_coletor() -> None:
+    """Encerra a thread de limpeza, se houver, e espera ela terminar."""
+    global _coletor
+    if _coletor is None:
+        return
+    thread, parar = _coletor
+    _coletor = None
+    parar.set()
+    if thread is not threading.current_thread():
+        thread.join()
+
+
+def _executar_coletor(parar: threading.Event) -> None:
+    """Laço da thread de limpeza; usa a própria conexão (uma por thread)."""
+    while not parar.wait(INTERVALO_COLETA):
+        try:
+            limpar_expirados()
+            with _lock:
+                _get_conn().execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Cache: falha na limpeza em segundo plano: %s", e)
+
+
+def _reiniciar_coletor_no_fork() -> None:
+    """No processo filho a thread de limpeza não existe: inicia uma nova.
+
+    As travas também são recriadas: se outra thread as segurava no fork, no filho
+    elas ficariam presas para sempre (ex: gunicorn --preload após cache.ativar()).
+    """
+    global _coletor, _lock, _lock_dfs
+    _lock = threading.RLock()
+    _lock_dfs = threading.Lock()
+    _coletor = None
+    if _ativo:
+        _iniciar_coletor()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reiniciar_coletor_no_fork)
+
+
 def esta_ativo() -> bool:
     """Retorna True se o cache está ativo."""
     return _ativo
@@ -102,6 +433,50 @@ def _gerar_chave(codigo: int, param_inicio: str, param_fim: str) -> str:
     return f"{codigo}:{param_inicio}:{param_fim}"
 
 
+def _obter_bytes(
+    chave: str, agora: float, ttl: Optional[int] = None
+) -> Optional[Tuple[bytes, float]]:
+    """Lê o payload cru do SQLite. Retorna (bytes, expira_em) ou None se miss/expirado."""
+    conn = _get_conn()
+    # Validade primeiro: entrada expirada não tem o payload lido
+    row = conn.execute(_SQL_SELECT_VALIDADE, (chave,)).fetchone()
+
+    if row is None:
+        return None
+
+    timestamp, expira_em = row
+    if ttl is not None:
+        expira_em = timestamp + ttl
+
+    if agora > expira_em:
+        # Cache expirado: a linha fica para a limpeza em segundo plano (ou é
+        # sobrescrita quando a série voltar da API), sem escrita na leitura
+        return None
+
+    row = conn.execute(_SQL_SELECT_DADOS, (chave,)).fetchone()
+    if row is None:  # Removida entre as duas consultas (ex: limpar em outra thread)
+        return None
+    return row[0], expira_em
+
+
+def _obter_df_sqlite(
+    chave: str, agora: float, ttl: Optional[int] = None
+) -> Optional[Tuple[pd.DataFrame, float]]:
+    """Lê e decodifica uma entrada do SQLite. Retorna (df, expira_em) ou None se miss/expirado.
+
+    Payloads em formato desconhecido (ex: gravados por versões antigas) contam
+    como miss: a série volta à API e a entrada é regravada no formato atual.
+    """
+    bruto = _obter_bytes(chave, agora, ttl)
+    if bruto is None:
+        return None
+    payload, expira_em = bruto
+    df = _decodificar(payload)
+    if df is None:
+        return None
+    return df, expira_em
+
+
 def obter(
     codigo: int, param_inicio: str, param_fim: str, ttl: Optional[int] = None
 ) -> Optional[List[Dict[str, str]]]:
@@ -119,29 +494,84 @@ def obter(
     if not _ativo:
         return None
 
-    chave = _gerar_chave(codigo, param_inicio, param_fim)
-    conn = _get_conn()
-    cursor = conn.execute(
-        "SELECT dados, timestamp, ttl FROM cache_series WHERE chave = ?",
-        (chave,),
-    )
-    row = cursor.fetchone()
-
-    if row is None:
+    lido = _obter_df_sqlite(_gerar_chave(codigo, param_inicio, param_fim), time.time(), ttl)
+    if lido is None:
         return None
 
-    dados_json, timestamp, ttl_salvo = row
-    ttl_efetivo = ttl if ttl is not None else ttl_salvo
-    idade = time.time() - timestamp
+    logger.debug("Cache hit para série %d (%s a %s)", codigo, param_inicio, param_fim)
+    return _df_para_registros(lido[0])
 
-    if idade > ttl_efetivo:
-        # Cache expirado
-        conn.execute("DELETE FROM cache_series WHERE chave = ?", (chave,))
-        conn.commit()
+
+def _guardar_df(chave: _Chave, df: pd.DataFrame, expira_em: float) -> None:
+    """Guarda um DataFrame na camada em memória, descartando o menos usado."""
+    with _lock_dfs:
+        _dfs[chave] = (df, expira_em)
+        _dfs.move_to_end(chave)
+        while len(_dfs) > MAX_DFS_MEMORIA:
+            _dfs.popitem(last=False)
+
+
+def obter_df(
+    codigo: int,
+    param_inicio: str,
+    param_fim: str,
+) -> Optional[pd.DataFrame]:
+    """Busca a série já convertida em DataFrame.
+
+    Procura primeiro na camada em memória; se não houver, lê o payload colunar
+    do SQLite (arrays numpy sobre os próprios bytes, sem parse) e guarda o
+    resultado em memória até a mesma expiração.
+
+    Returns:
+        Cópia do DataFrame em cache, ou None se cache miss/expirado.
+    """
+    if not _ativo:
         return None
 
+    chave = (codigo, param_inicio, param_fim)
+    agora = time.time()
+    with _lock_dfs:
+        item = _dfs.get(chave)
+        if item is not None:
+            if agora <= item[1]:
+                _dfs.move_to_end(chave)
+            else:
+                _dfs.pop(chave, None)
+                item = None
+    if item is not None:
+        logger.debug("Cache hit (memória) para série %d", codigo)
+        return item[0].copy()
+
+    lido = _obter_df_sqlite(_gerar_chave(*chave), agora)
+    if lido is None:
+        return None
+
+    df, expira_em = lido
+    _guardar_df(chave, df, expira_em)
     logger.debug("Cache hit para série %d (%s a %s)", codigo, param_inicio, param_fim)
-    return json.loads(dados_json)
+    return df.copy()
+
+
+def _montar_linha(
+    codigo: int,
+    param_inicio: str,
+    param_fim: str,
+    df: pd.DataFrame,
+    ttl: Optional[int] = None,
+) -> _Linha:
+    """Monta a linha (chave, timestamp, expires_at, dados) de uma entrada."""
+    ttl_efetivo = ttl if ttl is not None else TTL_DEFAULT
+    agora = time.time()
+    payload = _codificar(df)
+    return _gerar_chave(codigo, param_inicio, param_fim), agora, agora + ttl_efetivo, payload
+
+
+def _gravar(linhas: List[_Linha]) -> None:
+    """Grava as linhas numa única transação (um commit só)."""
+    conn = _get_conn()
+    with _lock:
+        conn.executemany(_SQL_INSERT, linhas)
+        conn.commit()
 
 
 def salvar(
@@ -153,28 +583,90 @@ def salvar(
 ) -> None:
     """Salva dados no cache.
 
+    Dentro de um bloco `lote()`, a escrita é adiada para o commit único do lote.
+
     Args:
         codigo: Código da série SGS.
         param_inicio: Data inicial formatada (DD/MM/YYYY).
         param_fim: Data final formatada (DD/MM/YYYY).
-        dados: Lista de dicts com dados da série.
+        dados: Lista de dicts com dados da série (gravada no formato colunar).
         ttl: TTL em segundos. Se omitido, usa TTL_DEFAULT.
     """
     if not _ativo:
         return
 
-    chave = _gerar_chave(codigo, param_inicio, param_fim)
-    ttl_efetivo = ttl if ttl is not None else TTL_DEFAULT
-    conn = _get_conn()
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO cache_series (chave, dados, timestamp, ttl)
-        VALUES (?, ?, ?, ?)
-        """,
-        (chave, json.dumps(dados), time.time(), ttl_efetivo),
-    )
-    conn.commit()
+    _salvar_df_sqlite(codigo, param_inicio, param_fim, _registros_para_df(dados), ttl)
+
+
+def _salvar_df_sqlite(
+    codigo: int,
+    param_inicio: str,
+    param_fim: str,
+    df: pd.DataFrame,
+    ttl: Optional[int] = None,
+) -> float:
+    """Grava o DataFrame no SQLite (ou no lote ativo), sem checar se o cache está ativo.
+
+    Returns:
+        Instante de expiração gravado (expires_at).
+    """
+    linha = _montar_linha(codigo, param_inicio, param_fim, df, ttl)
+    # Dados novos invalidam o DataFrame convertido em memória (salvar_df o repõe)
+    with _lock_dfs:
+        _dfs.pop((codigo, param_inicio, param_fim), None)
+    atual = _lote.get()
+    if atual is not None:
+        with _lock:  # Mesma trava do fechamento: a linha entra no lote ou é gravada já
+            if atual.aberto:
+                atual.linhas.append(linha)
+                return linha[2]
+    _gravar([linha])
     logger.debug("Cache salvo para série %d (%s a %s)", codigo, param_inicio, param_fim)
+    return linha[2]
+
+
+@contextmanager
+def lote() -> Iterator[None]:
+    """Agrupa as escritas feitas dentro do bloco num único commit, ao sair.
+
+    Vale também para tarefas asyncio criadas dentro do bloco (ex: o gather de
+    uma consulta com várias séries ou intervalos). Blocos aninhados usam o lote
+    mais externo.
+
+    Uso:
+        >>> with cache.lote():
+        ...     await asyncio.gather(*tarefas)
+    """
+    if _lote.get() is not None:
+        yield
+        return
+
+    atual = _Lote()
+    token = _lote.set(atual)
+    try:
+        yield
+    finally:
+        _lote.reset(token)
+        with _lock:
+            atual.aberto = False
+            if atual.linhas and _ativo:
+                _gravar(atual.linhas)
+                logger.debug("Cache salvo para %d entradas (lote)", len(atual.linhas))
+
+
+def salvar_df(
+    codigo: int,
+    param_inicio: str,
+    param_fim: str,
+    df: pd.DataFrame,
+    ttl: Optional[int] = None,
+) -> None:
+    """Salva o DataFrame já convertido: colunar no SQLite e como está na camada em memória."""
+    if not _ativo:
+        return
+
+    expira_em = _salvar_df_sqlite(codigo, param_inicio, param_fim, df, ttl)
+    _guardar_df((codigo, param_inicio, param_fim), df, expira_em)
 
 
 def limpar() -> None:
@@ -182,8 +674,12 @@ def limpar() -> None:
     if not _ativo:
         return
     conn = _get_conn()
-    conn.execute("DELETE FROM cache_series")
-    conn.commit()
+    with _lock:
+        conn.execute(_SQL_DELETE_TODOS)
+        conn.commit()
+        _compactar(conn, converter=True)
+    with _lock_dfs:
+        _dfs.clear()
     logger.info("Cache limpo.")
 
 
@@ -197,11 +693,15 @@ def limpar_expirados() -> int:
         return 0
     conn = _get_conn()
     agora = time.time()
-    cursor = conn.execute(
-        "DELETE FROM cache_series WHERE (? - timestamp) > ttl",
-        (agora,),
-    )
-    conn.commit()
+    with _lock:
+        cursor = conn.execute(_SQL_DELETE_EXPIRADOS, (agora,))
+        conn.commit()
+        if cursor.rowcount >= _LIMIAR_COMPACTAR:
+            _compactar(conn)
+    with _lock_dfs:
+        expirados = [chave for chave, (_, expira_em) in _dfs.items() if expira_em < agora]
+        for chave in expirados:
+            del _dfs[chave]
     removidos = cursor.rowcount
     if removidos:
         logger.info("Cache: %d entradas expiradas removidas.", removidos)
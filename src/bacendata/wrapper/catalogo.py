@@ -9,41 +9,50 @@ Permite buscar séries pelo nome em vez do código numérico:
     >>> selic = sgs.get("selic")
 """
 
-from typing import Dict, List, Optional
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Serie:
     """Metadados de uma série do catálogo."""
 
-    def __init__(
-        self,
-        codigo: int,
-        nome: str,
-        descricao: str,
-        periodicidade: str,
-        unidade: str,
-        aliases: Optional[List[str]] = None,
-    ) -> None:
-        self.codigo = codigo
-        self.nome = nome
-        self.descricao = descricao
-        self.periodicidade = periodicidade
-        self.unidade = unidade
-        self.aliases = aliases or []
+    codigo: int
+    nome: str
+    descricao: str
+    periodicidade: str
+    unidade: str
+    aliases: Tuple[str, ...] = ()
+    # Nome, descrição e aliases em minúsculas num único texto, calculado uma vez.
+    # O separador \x00 impede que um termo case atravessando dois campos.
+    _busca: str = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Poucos valores distintos repetidos em todas as séries: uma cópia só de cada
+        object.__setattr__(self, "periodicidade", sys.intern(self.periodicidade))
+        object.__setattr__(self, "unidade", sys.intern(self.unidade))
+        busca = "\x00".join([self.nome, self.descricao, *self.aliases]).lower()
+        object.__setattr__(self, "_busca", busca)
+
+    def contem(self, termo: str) -> bool:
+        """Indica se o termo (já em minúsculas) aparece no nome, descrição ou aliases."""
+        return termo in self._busca
 
     def __repr__(self) -> str:
         return f"Serie({self.codigo}, '{self.nome}', {self.periodicidade})"
 
 
 # Séries prioritárias definidas no CLAUDE.md
-CATALOGO: Dict[int, Serie] = {
+_SERIES: Dict[int, Serie] = {
     11: Serie(
         codigo=11,
         nome="Selic diária",
         descricao="Taxa de juros Selic diária",
         periodicidade="diária",
         unidade="% a.a.",
-        aliases=["selic", "selic_diaria"],
+        aliases=("selic", "selic_diaria"),
     ),
     12: Serie(
         codigo=12,
@@ -51,7 +60,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa Selic acumulada no mês",
         periodicidade="mensal",
         unidade="% a.m.",
-        aliases=["selic_mensal", "selic_acumulada"],
+        aliases=("selic_mensal", "selic_acumulada"),
     ),
     433: Serie(
         codigo=433,
@@ -59,7 +68,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="IPCA - Variação mensal",
         periodicidade="mensal",
         unidade="% a.m.",
-        aliases=["ipca", "inflacao"],
+        aliases=("ipca", "inflacao"),
     ),
     4390: Serie(
         codigo=4390,
@@ -67,7 +76,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa Selic acumulada no mês anualizada",
         periodicidade="mensal",
         unidade="% a.a.",
-        aliases=["selic_anual", "selic_anualizada"],
+        aliases=("selic_anual", "selic_anualizada"),
     ),
     1: Serie(
         codigo=1,
@@ -75,7 +84,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa de câmbio - Dólar americano (compra) - PTAX",
         periodicidade="diária",
         unidade="R$/US$",
-        aliases=["dolar", "usd", "ptax", "cambio"],
+        aliases=("dolar", "usd", "ptax", "cambio"),
     ),
     21619: Serie(
         codigo=21619,
@@ -83,7 +92,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa de câmbio - Livre - Euro (compra) - PTAX",
         periodicidade="diária",
         unidade="R$/EUR",
-        aliases=["euro", "eur"],
+        aliases=("euro", "eur"),
     ),
     4189: Serie(
         codigo=4189,
@@ -91,7 +100,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa média de juros - Pessoa Física",
         periodicidade="mensal",
         unidade="% a.a.",
-        aliases=["juros_pf", "taxa_pf"],
+        aliases=("juros_pf", "taxa_pf"),
     ),
     25434: Serie(
         codigo=25434,
@@ -99,7 +108,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Taxa média de juros - Crédito Livre Total",
         periodicidade="mensal",
         unidade="% a.a.",
-        aliases=["juros_credito", "credito_livre"],
+        aliases=("juros_credito", "credito_livre"),
     ),
     20542: Serie(
         codigo=20542,
@@ -107,7 +116,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Saldo da carteira de crédito com recursos livres - Total",
         periodicidade="mensal",
         unidade="R$ milhões",
-        aliases=["saldo_credito", "carteira_credito"],
+        aliases=("saldo_credito", "carteira_credito"),
     ),
     21112: Serie(
         codigo=21112,
@@ -115,7 +124,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Inadimplência da carteira de crédito - Pessoa Física",
         periodicidade="mensal",
         unidade="%",
-        aliases=["inadimplencia_pf", "default_pf"],
+        aliases=("inadimplencia_pf", "default_pf"),
     ),
     21082: Serie(
         codigo=21082,
@@ -123,7 +132,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Inadimplência da carteira de crédito - Pessoa Jurídica",
         periodicidade="mensal",
         unidade="%",
-        aliases=["inadimplencia_pj", "default_pj"],
+        aliases=("inadimplencia_pj", "default_pj"),
     ),
     7326: Serie(
         codigo=7326,
@@ -131,7 +140,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Reservas internacionais - Conceito liquidez",
         periodicidade="diária",
         unidade="US$ milhões",
-        aliases=["reservas", "reservas_internacionais"],
+        aliases=("reservas", "reservas_internacionais"),
     ),
     27574: Serie(
         codigo=27574,
@@ -139,7 +148,7 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Expectativa mediana do IPCA para os próximos 12 meses (Focus)",
         periodicidade="semanal",
         unidade="% a.a.",
-        aliases=["focus_ipca", "expectativa_ipca"],
+        aliases=("focus_ipca", "expectativa_ipca"),
     ),
     27575: Serie(
         codigo=27575,
@@ -147,16 +156,24 @@ CATALOGO: Dict[int, Serie] = {
         descricao="Expectativa mediana da taxa Selic (Focus)",
         periodicidade="semanal",
         unidade="% a.a.",
-        aliases=["focus_selic", "expectativa_selic"],
+        aliases=("focus_selic", "expectativa_selic"),
     ),
 }
 
-# Índice reverso: alias → código
-_ALIAS_MAP: Dict[str, int] = {}
-for _codigo, _serie in CATALOGO.items():
-    for _alias in _serie.aliases:
-        _ALIAS_MAP[_alias.lower()] = _codigo
-    _ALIAS_MAP[_serie.nome.lower()] = _codigo
+# Catálogo estático, exposto somente leitura
+CATALOGO: Mapping[int, Serie] = MappingProxyType(_SERIES)
+
+# O catálogo é estático: ordenado por código uma única vez
+_LISTA_ORDENADA: Tuple[Serie, ...] = tuple(sorted(_SERIES.values(), key=lambda s: s.codigo))
+
+# Índice reverso: alias/nome (casefold) → código, montado uma vez
+_ALIAS_MAP: Mapping[str, int] = MappingProxyType(
+    {
+        sys.intern(chave.casefold()): codigo
+        for codigo, serie in _SERIES.items()
+        for chave in (*serie.aliases, serie.nome)
+    }
+)
 
 
 def buscar_por_nome(nome: str) -> Optional[Serie]:
@@ -174,10 +191,7 @@ def buscar_por_nome(nome: str) -> Optional[Serie]:
         >>> buscar_por_nome("ipca")
         Serie(433, 'IPCA', mensal)
     """
-    codigo = _ALIAS_MAP.get(nome.lower())
-    if codigo is not None:
-        return CATALOGO[codigo]
-    return None
+    return _SERIES.get(_ALIAS_MAP.get(nome.casefold(), -1))
 
 
 def listar() -> List[Serie]:
@@ -186,7 +200,7 @@ def listar() -> List[Serie]:
     Returns:
         Lista de objetos Serie ordenada por código.
     """
-    return sorted(CATALOGO.values(), key=lambda s: s.codigo)
+    return list(_LISTA_ORDENADA)
 
 
 def resolver_codigo(codigo_ou_nome: object) -> int:
@@ -204,9 +218,10 @@ def resolver_codigo(codigo_ou_nome: object) -> int:
     if isinstance(codigo_ou_nome, int):
         return codigo_ou_nome
     if isinstance(codigo_ou_nome, str):
-        serie = buscar_por_nome(codigo_ou_nome)
-        if serie is not None:
-            return serie.codigo
+        # Direto no índice de aliases, sem passar pelo objeto Serie
+        codigo = _ALIAS_MAP.get(codigo_ou_nome.casefold())
+        if codigo is not None:
+            return codigo
         raise ValueError(
             f"Série '{codigo_ou_nome}' não encontrada no catálogo. "
             f"Use sgs.catalogo.listar() para ver as séries disponíveis."
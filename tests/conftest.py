@@ -0,0 +1,13 @@
+"""
+Fixtures compartilhadas pelos testes.
+"""
+
+import pytest
+
+from bacendata.wrapper import bacen_sgs
+
+
+@pytest.fixture(autouse=True)
+def sem_espera_entre_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Zera o backoff dos retries: os testes continuam exercitando o retry, sem dormir."""
+    monkeypatch.setattr(bacen_sgs, "RETRY_BACKOFF", [0, 0, 0])
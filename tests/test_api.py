@@ -5,6 +5,7 @@ Usa httpx.AsyncClient + respx para mockar as chamadas à API do BACEN.
 Webhook e auth usam SQLite em memória para testar persistência.
 """
 
+import json
 from unittest.mock import patch
 
 import httpx
@@ -26,11 +27,9 @@ DB_URL = "sqlite+aiosqlite:///:memory:"
 @pytest.fixture(autouse=True)
 def desativar_cache():
     """Garante cache desativado em todos os testes da API."""
-    cache._ativo = False
-    cache._conn = None
+    cache.desativar()
     yield
-    cache._ativo = False
-    cache._conn = None
+    cache.desativar()
 
 
 @pytest.fixture
@@ -48,6 +47,7 @@ def app():
         mock_settings.cache_ativo = False
         mock_settings.sentry_dsn = None
         mock_settings.database_url = DB_URL
+        mock_settings.redis_url = None
         mock_settings.stripe_webhook_secret = None
         mock_settings.stripe_price_pro = "price_test_pro"
         mock_settings.stripe_price_enterprise = "price_test_enterprise"
@@ -163,6 +163,32 @@ class TestGetSerie:
         response = client.get("/api/v1/series/99999?start=2024-01-01&end=2024-12-31")
         assert response.status_code == 404
 
+    @respx.mock
+    def test_get_serie_vazia(self, client: TestClient) -> None:
+        """Série sem dados no período retorna lista vazia."""
+        _mock_dados_sgs(11, [])
+
+        response = client.get("/api/v1/series/11?start=2024-01-01&end=2024-06-30")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 0
+        assert data["dados"] == []
+
+    @respx.mock
+    def test_get_serie_formato_columnar(self, client: TestClient) -> None:
+        """?format=columnar retorna datas e valores em listas paralelas."""
+        _mock_dados_sgs(11, DADOS_SELIC)
+
+        response = client.get("/api/v1/series/11?start=2024-01-01&end=2024-12-31&format=columnar")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 3
+        assert data["nome"] == "Selic diária"
+        assert data["dados"]["datas"][0] == "02/01/2024"
+        assert data["dados"]["valores"][0] == 11.65
+
     def test_get_serie_nome_invalido(self, client: TestClient) -> None:
         """Nome inexistente retorna 400."""
         response = client.get("/api/v1/series/serie_inexistente?start=2024-01-01&end=2024-12-31")
@@ -190,10 +216,6 @@ class TestMetadata:
     @respx.mock
     def test_get_metadata(self, client: TestClient) -> None:
         """GET /api/v1/series/{codigo}/metadata retorna metadados."""
-        # Mock do endpoint ultimos/1 (validação)
-        ultimos_url = ULTIMOS_URL.format(codigo=433, n=1)
-        respx.get(ultimos_url).mock(return_value=httpx.Response(200, json=DADOS_IPCA[:1]))
-
         # Mock do endpoint de metadados
         meta_url = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.433"
         respx.get(meta_url).mock(
@@ -367,6 +389,40 @@ class TestAuth:
         assert "X-RateLimit-Limit" in response.headers
         assert "X-RateLimit-Remaining" in response.headers
 
+    def test_rate_limit_redis_fora_do_ar(
+        self, client: TestClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Com o Redis fora do ar, conta em memória e só tenta de novo depois da pausa."""
+        import time
+
+        from bacendata.api.middleware import rate_limit
+
+        class RedisFora:
+            tentativas = 0
+
+            async def eval(self, *args):  # type: ignore[no-untyped-def]
+                RedisFora.tentativas += 1
+                raise ConnectionError("Redis fora do ar")
+
+            async def aclose(self) -> None:
+                pass
+
+        client.app.state.redis = RedisFora()
+        with caplog.at_level("WARNING", logger="bacendata"):
+            restantes = [
+                client.get("/api/v1/catalogo").headers["X-RateLimit-Remaining"] for _ in range(3)
+            ]
+            assert restantes == ["99", "98", "97"]
+            assert RedisFora.tentativas == 1
+
+            depois = time.time() + rate_limit.REDIS_PAUSA + 1
+            with patch.object(rate_limit.time, "time", return_value=depois):
+                client.get("/api/v1/catalogo")
+            assert RedisFora.tentativas == 2
+
+        avisos = [r for r in caplog.records if "Redis indisponível" in r.getMessage()]
+        assert len(avisos) == 1
+
 
 # ============================================================================
 # Testes de erro
@@ -444,6 +500,54 @@ class TestWebhookStripe:
         response2 = client.get("/api/v1/catalogo", headers={"X-API-Key": api_key})
         assert response2.status_code == 200
 
+    def test_verificar_assinatura(self) -> None:
+        """Assinatura v1 válida é aceita; secret errado ou timestamp antigo, não."""
+        import hashlib
+        import hmac
+        import time
+
+        from bacendata.api.routes.webhook import _verificar_assinatura
+
+        payload = b'{"type": "checkout.session.completed"}'
+        agora = str(int(time.time()))
+
+        def _header(secret: str, timestamp: str) -> str:
+            assinado = f"{timestamp}.".encode() + payload
+            sig = hmac.new(secret.encode(), assinado, hashlib.sha256).hexdigest()
+            return f"t={timestamp},v1={sig}"
+
+        assert _verificar_assinatura(payload, _header("whsec_teste", agora), "whsec_teste")
+        assert not _verificar_assinatura(payload, _header("outro", agora), "whsec_teste")
+        antigo = str(int(time.time()) - 600)
+        assert not _verificar_assinatura(payload, _header("whsec_teste", antigo), "whsec_teste")
+        assert not _verificar_assinatura(payload, "lixo", "whsec_teste")
+        # Vários v1 (rotação de secret): aceita se algum conferir
+        valido = _header("whsec_teste", agora)
+        multiplo = f"{_header('outro', agora)},{valido.split(',')[1]},v0=ignorado"
+        assert _verificar_assinatura(payload, multiplo, "whsec_teste")
+        # Um v1 malformado antes do válido não derruba o header inteiro
+        malformado = f"t={agora},v1=zz,{valido.split(',')[1]}"
+        assert _verificar_assinatura(payload, malformado, "whsec_teste")
+        assert not _verificar_assinatura(payload, f"t={agora},v1=zz", "whsec_teste")
+
+    def test_webhook_sem_db_registra_key_em_memoria(self, client: TestClient) -> None:
+        """Sem banco de dados, a key gerada fica em memória e autentica."""
+        from bacendata.api.routes import auth
+
+        with (
+            patch("bacendata.core.database.async_session", None),
+            patch.dict(auth._API_KEYS_MEMORIA, clear=True),
+        ):
+            response = client.post("/webhook/stripe", json=self._checkout_event())
+            api_key = response.json()["api_key"]
+            assert auth._API_KEYS_MEMORIA == {api_key: "pro"}
+
+            response2 = client.get("/api/v1/me", headers={"X-API-Key": api_key})
+            assert response2.json()["plano"] == "pro"
+
+            response3 = client.get("/api/v1/me", headers={"X-API-Key": "bcd_invalida"})
+            assert response3.status_code == 401
+
     def test_webhook_key_invalida_retorna_401(self, client: TestClient) -> None:
         """API key inexistente retorna 401 quando DB tem keys."""
         # Cria uma key válida para que o sistema tenha keys no banco
@@ -495,6 +599,22 @@ class TestWebhookStripe:
         )
         assert response.status_code == 400
 
+    def test_decodificar_evento_so_campos_usados(self) -> None:
+        """O evento decodificado mantém os campos usados e descarta o resto."""
+        pytest.importorskip("msgspec")
+        from bacendata.api.routes.webhook import _decodificar_evento
+
+        event = self._checkout_event()
+        event["data"]["object"]["customer_details"] = {"email": "x@y.com", "phone": "123"}
+        event["data"]["object"]["amount_total"] = 4900
+
+        decodificado = _decodificar_evento(json.dumps(event).encode())
+        sessao = decodificado["data"]["object"]
+        assert decodificado["type"] == "checkout.session.completed"
+        assert sessao["line_items"]["data"][0]["price"]["id"] == "price_test_pro"
+        assert sessao["customer_details"]["email"] == "x@y.com"
+        assert "amount_total" not in sessao
+
 
 # ============================================================================
 # Testes do Dashboard do Usuário
@@ -4,7 +4,11 @@ Testes unitários para o wrapper bacen_sgs.
 Utiliza respx para mockar chamadas HTTP à API do BACEN.
 """
 
+import asyncio
+import os
+import time
 from datetime import date, datetime
+from unittest.mock import patch
 
 import httpx
 import pandas as pd
@@ -15,15 +19,24 @@ from bacendata.wrapper import cache
 from bacendata.wrapper.bacen_sgs import (
     BASE_URL,
     ULTIMOS_URL,
+    _clientes,
     _dados_para_dataframe,
+    _formatar_data,
     _gerar_intervalos,
+    _get_client,
+    _get_loop,
+    _get_semaforo,
+    _intervalos_do_periodo,
     _parse_date,
+    _parse_date_str,
+    fechar_cliente,
     get,
     metadata,
 )
 from bacendata.wrapper.catalogo import buscar_por_nome, listar, resolver_codigo
 from bacendata.wrapper.exceptions import (
     BacenAPIError,
+    BacenTimeoutError,
     ParametrosInvalidos,
     SerieNaoEncontrada,
 )
@@ -64,10 +77,28 @@ class TestParseDate:
     def test_parse_br_string(self) -> None:
         assert _parse_date("15/03/2024") == date(2024, 3, 15)
 
+    def test_parse_sem_zeros_a_esquerda(self) -> None:
+        assert _parse_date("2024-3-5") == date(2024, 3, 5)
+        assert _parse_date("5/3/2024") == date(2024, 3, 5)
+
+    def test_parse_data_inexistente(self) -> None:
+        with pytest.raises(ParametrosInvalidos):
+            _parse_date("31/02/2024")
+
+    def test_parse_string_memoizado(self) -> None:
+        _parse_date("2019-07-01")
+        hits = _parse_date_str.cache_info().hits
+        assert _parse_date("2019-07-01") == date(2019, 7, 1)
+        assert _parse_date_str.cache_info().hits == hits + 1
+
     def test_parse_invalid_string(self) -> None:
         with pytest.raises(ParametrosInvalidos):
             _parse_date("invalid-date")
 
+    def test_parse_tipo_invalido(self) -> None:
+        with pytest.raises(ParametrosInvalidos):
+            _parse_date(20240101)  # type: ignore[arg-type]
+
     def test_parse_empty_string(self) -> None:
         with pytest.raises(ParametrosInvalidos):
             _parse_date("")
@@ -111,6 +142,31 @@ class TestGerarIntervalos:
         intervalos = _gerar_intervalos(inicio, fim)
         assert len(intervalos) == 3
 
+    def test_intervalo_de_um_dia(self) -> None:
+        d = date(2024, 5, 2)
+        assert _gerar_intervalos(d, d) == ((d, d),)
+
+    def test_intervalo_iniciando_em_29_de_fevereiro(self) -> None:
+        intervalos = _gerar_intervalos(date(2020, 2, 29), date(2035, 1, 1))
+        assert intervalos == (
+            (date(2020, 2, 29), date(2030, 2, 27)),
+            (date(2030, 2, 28), date(2035, 1, 1)),
+        )
+
+    def test_periodo_padrao_ultimos_10_anos(self) -> None:
+        """Sem início, o período cobre os últimos 10 anos (inclusive a partir de 29/02)."""
+        assert _intervalos_do_periodo(None, date(2024, 2, 29)) == (
+            (date(2015, 2, 28), date(2024, 2, 29)),
+        )
+
+    def test_periodo_invertido(self) -> None:
+        with pytest.raises(ParametrosInvalidos):
+            _intervalos_do_periodo(date(2024, 1, 2), date(2024, 1, 1))
+
+    def test_formatar_data_igual_strftime(self) -> None:
+        for d in (date(2024, 3, 5), date(1986, 12, 31), date(2000, 1, 1)):
+            assert _formatar_data(d) == d.strftime("%d/%m/%Y")
+
 
 # ============================================================================
 # Testes de _dados_para_dataframe
@@ -144,6 +200,15 @@ class TestDadosParaDataframe:
         df = _dados_para_dataframe(dados, 11)
         assert len(df) == 2
 
+    def test_duplicata_mantem_primeira_ocorrencia(self) -> None:
+        dados = [
+            {"data": "02/01/2024", "valor": "2.0"},
+            {"data": "01/01/2024", "valor": "1.0"},
+            {"data": "02/01/2024", "valor": "9.0"},
+        ]
+        df = _dados_para_dataframe(dados, 11)
+        assert df["valor"].tolist() == [1.0, 2.0]
+
     def test_ordena_por_data(self) -> None:
         dados = [
             {"data": "15/03/2024", "valor": "1.0"},
@@ -154,6 +219,36 @@ class TestDadosParaDataframe:
         datas = df.index.tolist()
         assert datas == sorted(datas)
 
+    def test_valores_ausentes_viram_nan(self) -> None:
+        dados = [
+            {"data": "01/01/2024", "valor": ""},
+            {"data": "02/01/2024"},
+            {"data": "03/01/2024", "valor": "1.5"},
+        ]
+        df = _dados_para_dataframe(dados, 11)
+        assert df["valor"].isna().tolist() == [True, True, False]
+
+    def test_valores_nao_numericos_viram_nan(self) -> None:
+        dados = [
+            {"data": "01/01/2024", "valor": "-"},
+            {"data": "02/01/2024", "valor": ""},
+            {"data": "03/01/2024", "valor": "1.5"},
+        ]
+        df = _dados_para_dataframe(dados, 11)
+        assert df["valor"].isna().tolist() == [True, True, False]
+        assert df["valor"].dtype == float
+
+    def test_datas_iguais_ao_parse_do_pandas(self) -> None:
+        """O parse por posições fixas dá o mesmo índice que pd.to_datetime."""
+        datas = ["29/02/2024", "31/12/1986", "01/03/2100", "15/08/2000"]
+        df = _dados_para_dataframe([{"data": d, "valor": "1"} for d in datas], 11)
+        esperado = pd.to_datetime(datas, format="%d/%m/%Y").sort_values()
+        pd.testing.assert_index_equal(df.index, pd.DatetimeIndex(esperado, name="data"))
+
+    def test_data_invalida_levanta_erro(self) -> None:
+        with pytest.raises(ValueError):
+            _dados_para_dataframe([{"data": "31/02/2024", "valor": "1"}], 11)
+
 
 # ============================================================================
 # Testes de get() - série única
@@ -313,6 +408,27 @@ class TestRetry:
         df = get(11, start="2024-01-01", end="2024-12-31")
         assert len(df) == 1
 
+    @respx.mock
+    def test_sem_espera_apos_ultima_tentativa(self) -> None:
+        """Esgotadas as tentativas, falha sem esperar mais um backoff."""
+        respx.get(BASE_URL.format(codigo=11)).mock(return_value=httpx.Response(500))
+
+        with patch("bacendata.wrapper.bacen_sgs._backoff", side_effect=[0, 0, 60]):
+            with pytest.raises(BacenTimeoutError):
+                get(11, start="2024-01-01", end="2024-12-31")
+        assert respx.calls.call_count == 3
+
+    @respx.mock
+    def test_retry_respeita_prazo_total(self) -> None:
+        """Não faz retry se a espera estourar RETRY_DEADLINE."""
+        route = respx.get(BASE_URL.format(codigo=11))
+        route.side_effect = [httpx.Response(500), httpx.Response(200, json=[])]
+
+        with patch("bacendata.wrapper.bacen_sgs.RETRY_DEADLINE", 0):
+            with pytest.raises(BacenTimeoutError):
+                get(11, start="2024-01-01", end="2024-12-31")
+        assert respx.calls.call_count == 1
+
 
 # ============================================================================
 # Testes de múltiplas séries
@@ -366,6 +482,55 @@ class TestMultiplasSeries:
         assert "IPCA" in df.columns
 
 
+class TestClienteHTTP:
+    def test_cliente_reutilizado_no_mesmo_loop(self) -> None:
+        """O mesmo event loop reaproveita um único cliente HTTP até ser fechado."""
+
+        async def _clientes_do_loop():  # type: ignore[no-untyped-def]
+            c1, c2 = _get_client(), _get_client()
+            await fechar_cliente()
+            return c1, c2
+
+        c1, c2 = asyncio.run(_clientes_do_loop())
+        assert c1 is c2
+        assert c1.is_closed
+
+    @respx.mock
+    def test_get_sincrono_reutiliza_loop_e_cliente(self) -> None:
+        """Chamadas síncronas seguidas rodam no mesmo loop de fundo e cliente HTTP."""
+        respx.get(ULTIMOS_URL.format(codigo=11, n=1)).mock(
+            return_value=httpx.Response(200, json=_mock_dados(1))
+        )
+        get(11, last=1)
+        loop = _get_loop()
+        cliente = _clientes[loop]
+        get(11, last=1)
+        assert _get_loop() is loop
+        assert _clientes[loop] is cliente
+        assert not cliente.is_closed
+
+    def test_get_sincrono_dentro_de_loop_async(self) -> None:
+        """get() síncrono funciona mesmo chamado de dentro de um loop já rodando."""
+
+        async def _dentro_do_loop():  # type: ignore[no-untyped-def]
+            with respx.mock:
+                respx.get(ULTIMOS_URL.format(codigo=11, n=1)).mock(
+                    return_value=httpx.Response(200, json=_mock_dados(1))
+                )
+                return get(11, last=1)
+
+        assert len(asyncio.run(_dentro_do_loop())) == 1
+
+    def test_semaforo_compartilhado_no_mesmo_loop(self) -> None:
+        """Todas as consultas do mesmo loop dividem um único semáforo."""
+
+        async def _semaforos_do_loop():  # type: ignore[no-untyped-def]
+            return _get_semaforo(), _get_semaforo()
+
+        s1, s2 = asyncio.run(_semaforos_do_loop())
+        assert s1 is s2
+
+
 # ============================================================================
 # Testes de metadata
 # ============================================================================
@@ -374,13 +539,9 @@ class TestMultiplasSeries:
 class TestMetadata:
     @respx.mock
     def test_metadata_basico(self) -> None:
-        """Busca metadados de uma série."""
-        ultimos_url = ULTIMOS_URL.format(codigo=11, n=1)
+        """Busca metadados de uma série numa única requisição."""
         meta_url = f"https://api.bcb.gov.br/dados/serie/bcdata.sgs.{11}"
 
-        respx.get(ultimos_url).mock(
-            return_value=httpx.Response(200, json=[{"data": "01/01/2024", "valor": "11.75"}])
-        )
         respx.get(meta_url).mock(
             return_value=httpx.Response(
                 200,
@@ -399,16 +560,45 @@ class TestMetadata:
         assert info["codigo"] == 11
         assert info["nome"] == "Taxa de juros - Selic"
         assert info["periodicidade"] == "Diária"
+        assert respx.calls.call_count == 1
+
+    @respx.mock
+    def test_metadata_sem_endpoint_valida_pelo_ultimo_valor(self) -> None:
+        """Sem metadados em JSON, valida a série pelo último valor e devolve o mínimo."""
+        respx.get("https://api.bcb.gov.br/dados/serie/bcdata.sgs.11").mock(
+            return_value=httpx.Response(200, text="<html></html>")
+        )
+        respx.get(ULTIMOS_URL.format(codigo=11, n=1)).mock(
+            return_value=httpx.Response(200, json=[{"data": "01/01/2024", "valor": "11.75"}])
+        )
+
+        info = metadata(11)
+        assert info["codigo"] == 11
+        assert info["nome"] is None
 
     @respx.mock
     def test_metadata_serie_inexistente(self) -> None:
         """Metadados de série inexistente deve levantar exceção."""
         ultimos_url = ULTIMOS_URL.format(codigo=99999, n=1)
+        meta_url = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.99999"
+        respx.get(meta_url).mock(return_value=httpx.Response(404))
         respx.get(ultimos_url).mock(return_value=httpx.Response(404))
 
         with pytest.raises(SerieNaoEncontrada):
             metadata(99999)
 
+    @respx.mock
+    def test_metadata_timeout_nao_tenta_fallback(self) -> None:
+        """Timeout no endpoint de metadados levanta na hora, sem o segundo timeout do fallback."""
+        respx.get("https://api.bcb.gov.br/dados/serie/bcdata.sgs.11").mock(
+            side_effect=httpx.ReadTimeout("timeout")
+        )
+        ultimos = respx.get(ULTIMOS_URL.format(codigo=11, n=1))
+
+        with pytest.raises(BacenTimeoutError):
+            metadata(11)
+        assert not ultimos.called
+
 
 # ============================================================================
 # Testes de formatos de data aceitos
@@ -466,6 +656,15 @@ class TestCatalogo:
         """Série inexistente retorna None."""
         assert buscar_por_nome("serie_que_nao_existe") is None
 
+    def test_contem_termo(self) -> None:
+        """Busca textual considera nome, descrição e aliases."""
+        serie = buscar_por_nome("selic")
+        assert serie is not None
+        assert serie.contem("diária")
+        assert serie.contem("juros")
+        assert serie.contem("selic_diaria")
+        assert not serie.contem("ipca")
+
     def test_listar(self) -> None:
         """Lista retorna todas as séries ordenadas por código."""
         series = listar()
@@ -607,3 +806,286 @@ class TestCache:
         df2 = get(11, start="2024-01-01", end="2024-12-31")
         assert len(df2) == 1
         assert respx.calls.call_count == 1  # Não fez nova requisição
+
+    def test_cache_obter_df_converte_uma_vez(self) -> None:
+        """obter_df decodifica o SQLite uma única vez e depois serve da memória."""
+        dados = [{"data": "02/01/2024", "valor": "11.75"}]
+        cache.salvar(11, "01/01/2024", "31/12/2024", dados)
+
+        with patch.object(cache, "_decodificar", wraps=cache._decodificar) as decodificar:
+            df1 = cache.obter_df(11, "01/01/2024", "31/12/2024")
+            df1["valor"] = 0.0  # Mutação não deve afetar o cache
+            df2 = cache.obter_df(11, "01/01/2024", "31/12/2024")
+
+        assert decodificar.call_count == 1
+        assert df2["valor"].iloc[0] == 11.75
+
+    @respx.mock
+    def test_cache_periodo_encerrado_usa_ttl_historico(self) -> None:
+        """Períodos que já terminaram ficam no cache com TTL_HISTORICO."""
+        respx.get(BASE_URL.format(codigo=11)).mock(
+            return_value=httpx.Response(200, json=[{"data": "02/01/2020", "valor": "4.40"}])
+        )
+        get(11, start="2020-01-01", end="2020-12-31")
+
+        conn = cache._get_conn()
+        ttls = [row[0] for row in conn.execute("SELECT expires_at - timestamp FROM cache_series")]
+        assert ttls == [pytest.approx(cache.TTL_HISTORICO)]
+
+    def test_cache_migra_schema_antigo(self) -> None:
+        """Tabela no schema antigo (dados TEXT + ttl) é recriada no novo."""
+        import sqlite3
+
+        cache.desativar()
+        conn = sqlite3.connect(self._tmpfile.name)
+        conn.execute(
+            "CREATE TABLE cache_series (chave TEXT PRIMARY KEY, dados TEXT NOT NULL, "
+            "timestamp REAL NOT NULL, ttl INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT INTO cache_series VALUES ('11:a:b', '[]', 0, 3600)")
+        conn.commit()
+        conn.close()
+
+        cache.ativar(self._tmpfile.name)
+        dados = [{"data": "01/01/2024", "valor": "11.75"}]
+        cache.salvar(11, "01/01/2024", "31/12/2024", dados)
+        assert cache.obter(11, "01/01/2024", "31/12/2024") == dados
+        assert cache.limpar_expirados() == 0
+
+    def test_cache_lote_grava_ao_sair(self) -> None:
+        """Dentro de lote(), escritas (inclusive de tarefas asyncio) só vão ao SQLite na saída."""
+        dados = [{"data": "01/01/2024", "valor": "11.75"}]
+
+        async def _salvar_em_tarefas():  # type: ignore[no-untyped-def]
+            with cache.lote():
+                await asyncio.gather(_salvar(11), _salvar(433))
+                assert cache.obter(11, "01/01/2024", "31/12/2024") is None
+
+        async def _salvar(codigo: int) -> None:
+            cache.salvar(codigo, "01/01/2024", "31/12/2024", dados)
+
+        asyncio.run(_salvar_em_tarefas())
+        assert cache.obter(11, "01/01/2024", "31/12/2024") == dados
+        assert cache.obter(433, "01/01/2024", "31/12/2024") == dados
+
+    def test_cache_lote_escrita_apos_fechar_vai_ao_sqlite(self) -> None:
+        """Tarefa irmã que termina depois de o gather falhar ainda grava no SQLite."""
+        dados = [{"data": "01/01/2024", "valor": "11.75"}]
+
+        async def _falhar() -> None:
+            raise RuntimeError("falha")
+
+        async def _salvar_depois() -> None:
+            await asyncio.sleep(0.01)
+            cache.salvar(433, "01/01/2024", "31/12/2024", dados)
+
+        async def _executar():  # type: ignore[no-untyped-def]
+            with pytest.raises(RuntimeError):
+                with cache.lote():
+                    tardia = asyncio.ensure_future(_salvar_depois())
+                    await asyncio.gather(_falhar(), tardia)
+            await tardia
+
+        asyncio.run(_executar())
+        assert cache.obter(433, "01/01/2024", "31/12/2024") == dados
+
+    def test_cache_conexao_por_thread(self) -> None:
+        """Cada thread usa a sua conexão, e todas enxergam os mesmos dados."""
+        import threading
+
+        dados = [{"data": "01/01/2024", "valor": "11.75"}]
+        cache.salvar(11, "01/01/2024", "31/12/2024", dados)
+        resultado = {}
+
+        def _ler() -> None:
+            resultado["conn"] = cache._get_conn()
+            resultado["dados"] = cache.obter(11, "01/01/2024", "31/12/2024")
+
+        thread = threading.Thread(target=_ler)
+        thread.start()
+        thread.join()
+
+        assert resultado["conn"] is not cache._get_conn()
+        assert resultado["dados"] == dados
+
+    def test_cache_salvar_invalida_df_em_memoria(self) -> None:
+        """salvar() com dados novos não deixa o DataFrame antigo na memória."""
+        cache.salvar(11, "01/01/2024", "31/12/2024", [{"data": "01/01/2024", "valor": "1"}])
+        cache.obter_df(11, "01/01/2024", "31/12/2024")
+
+        cache.salvar(11, "01/01/2024", "31/12/2024", [{"data": "01/01/2024", "valor": "2"}])
+        df = cache.obter_df(11, "01/01/2024", "31/12/2024")
+
+        assert df["valor"].iloc[0] == 2.0
+
+    def test_cache_hit_em_memoria_nao_monta_chave_sql(self) -> None:
+        """Hit na camada em memória não gera a chave string do SQLite."""
+        df = _dados_para_dataframe([{"data": "02/01/2024", "valor": "11.75"}], 11)
+        cache.salvar_df(11, "01/01/2024", "31/12/2024", df)
+
+        with patch.object(cache, "_gerar_chave", wraps=cache._gerar_chave) as gerar_chave:
+            pd.testing.assert_frame_equal(cache.obter_df(11, "01/01/2024", "31/12/2024"), df)
+
+        gerar_chave.assert_not_called()
+
+    def test_cache_obter_df_le_do_sqlite(self) -> None:
+        """Sem a camada em memória, obter_df hidrata o DataFrame a partir do SQLite."""
+        dados = [{"data": "02/01/2024", "valor": "11.75"}]
+        cache.salvar(11, "01/01/2024", "31/12/2024", dados)
+        cache._dfs.clear()
+
+        pd.testing.assert_frame_equal(
+            cache.obter_df(11, "01/01/2024", "31/12/2024"), _dados_para_dataframe(dados, 11)
+        )
+        assert cache.obter_df(11, "01/01/2023", "31/12/2023") is None
+
+    def test_cache_limpar_expirados_compacta_arquivo(self) -> None:
+        """Banco novo usa auto_vacuum incremental e limpar_expirados devolve as páginas."""
+        dados = [{"data": "01/01/2024", "valor": str(i)} for i in range(500)]
+        for codigo in range(cache._LIMIAR_COMPACTAR):
+            cache.salvar(codigo, "01/01/2024", "31/12/2024", dados, ttl=0)
+        conn = cache._get_conn()
+        paginas_cheio = conn.execute("PRAGMA page_count").fetchone()[0]
+
+        time.sleep(0.01)
+        assert cache.limpar_expirados() == cache._LIMIAR_COMPACTAR
+
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == cache._AUTO_VACUUM_INCREMENTAL
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        assert conn.execute("PRAGMA page_count").fetchone()[0] < paginas_cheio
+
+    def test_cache_coletor_remove_expirados(self) -> None:
+        """A leitura não apaga entradas expiradas; a thread de limpeza, sim."""
+        dados = [{"data": "01/01/2024", "valor": "11.75"}]
+        cache.salvar(11, "01/01/2024", "31/12/2024", dados, ttl=0)
+        time.sleep(0.01)
+        assert cache.obter(11, "01/01/2024", "31/12/2024") is None
+
+        conn = cache._get_conn()
+        assert conn.execute("SELECT COUNT(*) FROM cache_series").fetchone()[0] == 1
+
+        with patch.object(cache, "INTERVALO_COLETA", 0.01):
+            cache._parar_coletor()
+            cache._iniciar_coletor()
+            for _ in range(200):
+                if conn.execute("SELECT COUNT(*) FROM cache_series").fetchone()[0] == 0:
+                    break
+                time.sleep(0.01)
+            cache._parar_coletor()
+
+        assert conn.execute("SELECT COUNT(*) FROM cache_series").fetchone()[0] == 0
+
+    def test_cache_coletor_concorrente_com_obter_df(self) -> None:
+        """A coleta removendo a mesma chave expirada no meio de obter_df dá só um miss."""
+        import threading
+        from collections import OrderedDict
+
+        lendo, coletou = threading.Event(), threading.Event()
+
+        class DfsLento(OrderedDict):
+            def get(self, chave, padrao=None):  # type: ignore[override]
+                item = super().get(chave, padrao)
+                lendo.set()
+                coletou.wait(0.2)  # Janela para a coleta agir entre o get e a remoção
+                return item
+
+        df = _dados_para_dataframe([{"data": "02/01/2024", "valor": "11.75"}], 11)
+        cache.salvar_df(11, "01/01/2024", "31/12/2024", df, ttl=0)
+        time.sleep(0.01)
+
+        def coletar() -> None:
+            lendo.wait(1)
+            cache.limpar_expirados()
+            coletou.set()
+
+        with patch.object(cache, "_dfs", DfsLento(cache._dfs)):
+            coletor = threading.Thread(target=coletar)
+            coletor.start()
+            assert cache.obter_df(11, "01/01/2024", "31/12/2024") is None
+            coletor.join()
+            assert len(cache._dfs) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+    def test_cache_fork_com_trava_presa(self) -> None:
+        """Fork enquanto outra thread segura as travas: o filho ainda lê e grava."""
+        import signal
+        import threading
+
+        segurando, soltar = threading.Event(), threading.Event()
+
+        def _segurar() -> None:
+            with cache._lock, cache._lock_dfs:
+                segurando.set()
+                soltar.wait(10)
+
+        thread = threading.Thread(target=_segurar)
+        thread.start()
+        segurando.wait(1)
+        try:
+            pid = os.fork()
+            if pid == 0:  # Filho: sai com 1 se travar (alarm) ou falhar
+                signal.alarm(5)
+                ok = False
+                try:
+                    dados = [{"data": "02/01/2024", "valor": "11.75"}]
+                    cache.salvar(11, "01/01/2024", "31/12/2024", dados)
+                    ok = cache.obter_df(11, "01/01/2024", "31/12/2024") is not None
+                finally:
+                    os._exit(0 if ok else 1)
+            _, status = os.waitpid(pid, 0)
+        finally:
+            soltar.set()
+            thread.join()
+
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+    def test_cache_payload_colunar(self) -> None:
+        """O payload colunar volta como o mesmo DataFrame, inclusive com valor ausente."""
+        df = _dados_para_dataframe(
+            [{"data": "02/01/2024", "valor": "11.75"}, {"data": "03/01/2024", "valor": ""}], 11
+        )
+        cache.salvar_df(11, "01/01/2024", "31/12/2024", df)
+        cache._dfs.clear()  # Força a leitura do SQLite
+
+        chave = cache._gerar_chave(11, "01/01/2024", "31/12/2024")
+        payload = cache._get_conn().execute(cache._SQL_SELECT_DADOS, (chave,)).fetchone()[0]
+        assert len(payload) == 16 + 2 * 8  # Cabeçalho + int32 (valor) + int32 (data) por linha
+        pd.testing.assert_frame_equal(cache.obter_df(11, "01/01/2024", "31/12/2024"), df)
+        assert cache.obter(11, "01/01/2024", "31/12/2024") == [
+            {"data": "02/01/2024", "valor": "11.75"},
+            {"data": "03/01/2024", "valor": ""},
+        ]
+
+    def test_cache_quantizacao_sem_perda(self) -> None:
+        """Valores viram int32 com escala decimal só quando a volta é exata."""
+        datas = pd.DatetimeIndex(pd.to_datetime(["02/01/2024", "03/01/2024"], dayfirst=True))
+        casos = [
+            ([11.65, 0.0001], cache._VALORES_INT32, 4),
+            ([1500000.5, -3.0], cache._VALORES_INT32, 1),
+            ([9876543210.0, 1.0], cache._VALORES_FLOAT64, 0),  # Não cabe em int32
+            ([0.123456, 1.0], cache._VALORES_FLOAT64, 0),  # Precisaria de escala > 4
+        ]
+        for valores, tipo, escala in casos:
+            df = pd.DataFrame({"valor": valores}, index=datas.rename("data"))
+            df.index = df.index.astype(cache._DTYPE_DATA)
+            payload = cache._codificar(df)
+
+            assert cache._CABECALHO.unpack_from(payload)[2:] == (tipo, escala)
+            pd.testing.assert_frame_equal(cache._decodificar(payload), df)
+
+    def test_cache_payload_desconhecido_e_miss(self) -> None:
+        """Entrada num formato antigo (JSON) é tratada como miss, sem erro."""
+        conn = cache._get_conn()
+        conn.execute(
+            cache._SQL_INSERT,
+            (
+                cache._gerar_chave(11, "01/01/2024", "31/12/2024"),
+                time.time(),
+                time.time() + 3600,
+                b"[]",
+            ),
+        )
+        conn.commit()
+
+        assert cache.obter(11, "01/01/2024", "31/12/2024") is None
+        assert cache.obter_df(11, "01/01/2024", "31/12/2024") is None